@@ -1,23 +1,38 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func, distinct, case, extract
+from sqlalchemy import func, distinct, case, extract, and_, select
 from typing import Optional
-from database.models import Promotion, Cycle, get_db
+from database.models import Promotion, PromotionSummary, Cycle, get_db
+from api.cache import cached
 
 router = APIRouter(prefix="/api/analytics", tags=["analytics"])
 
+SEASON_ORDER = {"spring": 0, "bts": 1, "holiday": 2}
+
+
+def _mean(total_col, count_col):
+    """Mean over pre-aggregated PromotionSummary rows; NULL when no values contributed."""
+    return func.sum(total_col) / func.nullif(func.sum(count_col), 0)
+
+
+# Built once at import; every aggregate is computed in a single scan
+_SUMMARY_STMT = select(
+    func.count(Promotion.id),
+    func.count(distinct(Promotion.retailer)),
+    func.count(distinct(Promotion.vendor)),
+    func.count(distinct(Promotion.cycle)),
+    func.avg(Promotion.discount_pct),
+    func.max(Promotion.week_date),
+    func.min(Promotion.week_date),
+).where(Promotion.review_status == "approved")
+
 
 @router.get("/summary")
+@cached("analytics")
 def get_summary(db: Session = Depends(get_db)):
     # [FIX] Filter by approved status consistently with all other endpoints
-    approved = Promotion.review_status == "approved"
-    total = db.query(func.count(Promotion.id)).filter(approved).scalar()
-    retailers = db.query(func.count(distinct(Promotion.retailer))).filter(approved).scalar()
-    vendors = db.query(func.count(distinct(Promotion.vendor))).filter(approved).scalar()
-    cycles = db.query(func.count(distinct(Promotion.cycle))).filter(approved).scalar()
-    avg_discount = db.query(func.avg(Promotion.discount_pct)).filter(approved, Promotion.discount_pct.isnot(None)).scalar()
-    latest_date = db.query(func.max(Promotion.week_date)).filter(approved).scalar()
-    earliest_date = db.query(func.min(Promotion.week_date)).filter(approved).scalar()
+    row = db.execute(_SUMMARY_STMT).one()
+    total, retailers, vendors, cycles, avg_discount, latest_date, earliest_date = row
 
     return {
         "total_promotions": total,
@@ -33,23 +48,26 @@ def get_summary(db: Session = Depends(get_db)):
 
 
 @router.get("/by-retailer")
+@cached("analytics")
 def promotions_by_retailer(
     cycle: Optional[str] = None,
     db: Session = Depends(get_db),
 ):
+    s = PromotionSummary
+    count = func.sum(s.promo_count)
     q = db.query(
-        Promotion.retailer,
-        func.count(Promotion.id).label("count"),
-        func.avg(Promotion.ad_price).label("avg_price"),
-        func.avg(Promotion.discount_pct).label("avg_discount_pct"),
-        func.min(Promotion.ad_price).label("min_price"),
-        func.max(Promotion.ad_price).label("max_price"),
-    ).filter(Promotion.review_status == "approved")
+        s.retailer,
+        count.label("count"),
+        _mean(s.price_sum, s.price_count).label("avg_price"),
+        _mean(s.discount_pct_sum, s.discount_pct_count).label("avg_discount_pct"),
+        func.min(s.price_min).label("min_price"),
+        func.max(s.price_max).label("max_price"),
+    )
 
     if cycle:
-        q = q.filter(Promotion.cycle == cycle)
+        q = q.filter(s.cycle == cycle)
 
-    results = q.group_by(Promotion.retailer).order_by(func.count(Promotion.id).desc()).all()
+    results = q.group_by(s.retailer).order_by(count.desc()).all()
 
     return [
         {
@@ -65,24 +83,27 @@ def promotions_by_retailer(
 
 
 @router.get("/by-vendor")
+@cached("analytics")
 def promotions_by_vendor(
     retailer: Optional[str] = None,
     cycle: Optional[str] = None,
     db: Session = Depends(get_db),
 ):
+    s = PromotionSummary
+    count = func.sum(s.promo_count)
     q = db.query(
-        Promotion.vendor,
-        func.count(Promotion.id).label("count"),
-        func.avg(Promotion.ad_price).label("avg_price"),
-        func.avg(Promotion.discount_pct).label("avg_discount_pct"),
-    ).filter(Promotion.review_status == "approved")
+        s.vendor,
+        count.label("count"),
+        _mean(s.price_sum, s.price_count).label("avg_price"),
+        _mean(s.discount_pct_sum, s.discount_pct_count).label("avg_discount_pct"),
+    )
 
     if retailer:
-        q = q.filter(Promotion.retailer == retailer)
+        q = q.filter(s.retailer == retailer)
     if cycle:
-        q = q.filter(Promotion.cycle == cycle)
+        q = q.filter(s.cycle == cycle)
 
-    results = q.group_by(Promotion.vendor).order_by(func.count(Promotion.id).desc()).all()
+    results = q.group_by(s.vendor).order_by(count.desc()).all()
 
     return [
         {
@@ -96,40 +117,36 @@ def promotions_by_vendor(
 
 
 @router.get("/discount-trends")
+@cached("analytics")
 def discount_trends(
     retailer: Optional[str] = None,
     vendor: Optional[str] = None,
     db: Session = Depends(get_db),
 ):
+    # Only promotions with a discount_pct contribute to trends
+    s = PromotionSummary
     q = db.query(
-        Promotion.cycle,
-        func.avg(Promotion.discount_pct).label("avg_discount_pct"),
-        func.avg(Promotion.discount).label("avg_discount_dollars"),
-        func.avg(Promotion.ad_price).label("avg_price"),
-        func.count(Promotion.id).label("count"),
-    ).filter(
-        Promotion.review_status == "approved",
-        Promotion.discount_pct.isnot(None),
-    )
+        s.cycle,
+        _mean(s.discount_pct_sum, s.discount_pct_count).label("avg_discount_pct"),
+        _mean(s.discounted_dollars_sum, s.discounted_dollars_count).label("avg_discount_dollars"),
+        _mean(s.discounted_price_sum, s.discounted_price_count).label("avg_price"),
+        func.sum(s.discount_pct_count).label("count"),
+    ).filter(s.discount_pct_count > 0)
 
     if retailer:
-        q = q.filter(Promotion.retailer == retailer)
+        q = q.filter(s.retailer == retailer)
     if vendor:
-        q = q.filter(Promotion.vendor == vendor)
+        q = q.filter(s.vendor == vendor)
 
-    results = q.group_by(Promotion.cycle).all()
+    results = q.group_by(s.cycle).all()
 
     # [FIX] Dynamic cycle ordering from cycles table instead of hardcoded list
-    season_order = {"spring": 0, "bts": 1, "holiday": 2}
-    db_cycles = db.query(Cycle).all()
-    if db_cycles:
-        cycle_order = sorted(
-            [c.code for c in db_cycles],
-            key=lambda code: next(
-                ((c.year, season_order.get(c.season, 9)) for c in db_cycles if c.code == code),
-                (9999, 9),
-            ),
-        )
+    order_map = {
+        code: (year, SEASON_ORDER.get(season, 9))
+        for code, year, season in db.query(Cycle.code, Cycle.year, Cycle.season)
+    }
+    if order_map:
+        cycle_order = sorted(order_map, key=order_map.get)
     else:
         # Fallback: sort result cycles alphabetically if no cycles table data
         cycle_order = sorted([r.cycle for r in results if r.cycle])
@@ -150,6 +167,7 @@ def discount_trends(
 
 
 @router.get("/price-distribution")
+@cached("analytics")
 def price_distribution(
     retailer: Optional[str] = None,
     vendor: Optional[str] = None,
@@ -175,29 +193,36 @@ def price_distribution(
     if cycle:
         q = q.filter(Promotion.cycle == cycle)
 
-    results = []
-    for label, low, high in bands:
-        count = q.filter(Promotion.ad_price >= low, Promotion.ad_price < high).count()
-        results.append({"band": label, "count": count})
+    # Count every band in one scan with a CASE per band instead of one COUNT query each
+    buckets = [
+        func.sum(case((and_(Promotion.ad_price >= low, Promotion.ad_price < high), 1), else_=0))
+        for _, low, high in bands
+    ]
+    row = q.with_entities(*buckets).one()
 
-    return results
+    return [
+        {"band": label, "count": count or 0}
+        for (label, _, _), count in zip(bands, row)
+    ]
 
 
 @router.get("/vendor-retailer-heatmap")
+@cached("analytics")
 def vendor_retailer_heatmap(
     cycle: Optional[str] = None,
     db: Session = Depends(get_db),
 ):
+    s = PromotionSummary
     q = db.query(
-        Promotion.vendor,
-        Promotion.retailer,
-        func.count(Promotion.id).label("count"),
-    ).filter(Promotion.review_status == "approved")
+        s.vendor,
+        s.retailer,
+        func.sum(s.promo_count).label("count"),
+    )
 
     if cycle:
-        q = q.filter(Promotion.cycle == cycle)
+        q = q.filter(s.cycle == cycle)
 
-    results = q.group_by(Promotion.vendor, Promotion.retailer).all()
+    results = q.group_by(s.vendor, s.retailer).all()
 
     return [
         {"vendor": r.vendor, "retailer": r.retailer, "count": r.count}
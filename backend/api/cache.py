@@ -0,0 +1,141 @@
+"""In-process response cache with stale-while-revalidate for read-heavy endpoints."""
+
+import functools
+import logging
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Callable, Optional
+
+from fastapi import Response
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_AGE = 30
+DEFAULT_STALE_WHILE_REVALIDATE = 300
+# HTTP caching for slow-changing catalogs (retailers, filter options)
+CATALOG_CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=300"
+
+# Keys include free-form query params, so bound the number of entries (least recently used go first)
+MAX_CACHE_ENTRIES = 512
+
+# key -> (stored_at, expires_at, value); key is (namespace, endpoint name, sorted query params).
+# Past expires_at (max_age + stale_while_revalidate) an entry is never served again.
+_cache: "OrderedDict[tuple, tuple[float, float, Any]]" = OrderedDict()
+_refreshing: set[tuple] = set()
+# Bumped by clear_cache (None for a full clear); a value computed across a clear is not stored
+_generations: "defaultdict[Optional[str], int]" = defaultdict(int)
+_lock = threading.Lock()
+
+
+def cached(
+    namespace: str,
+    max_age: float = DEFAULT_MAX_AGE,
+    stale_while_revalidate: float = DEFAULT_STALE_WHILE_REVALIDATE,
+) -> Callable:
+    """
+    Cache an endpoint's return value keyed by its query parameters.
+
+    Fresh entries (younger than max_age) are returned directly. Stale entries within the
+    stale_while_revalidate window are returned immediately while a background thread
+    recomputes them with its own DB session. Anything older is recomputed inline.
+    At most MAX_CACHE_ENTRIES are kept; expired and least recently used entries are dropped.
+    A value whose computation overlapped a clear_cache of its namespace is returned but not stored.
+
+    The decorated endpoint must take its session as a ``db`` keyword argument.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(**kwargs):
+            db = kwargs.pop("db")
+            key = (namespace, func.__name__, tuple(sorted(kwargs.items())))
+            with _lock:
+                entry = _cache.get(key)
+                if entry is not None:
+                    _cache.move_to_end(key)
+                generation = _generation(namespace)
+            if entry is not None:
+                stored_at, expires_at, value = entry
+                now = time.monotonic()
+                if now - stored_at < max_age:
+                    return value
+                if now < expires_at:
+                    _schedule_refresh(key, func, kwargs, max_age + stale_while_revalidate, generation)
+                    return value
+
+            value = func(db=db, **kwargs)
+            _store(key, value, max_age + stale_while_revalidate, generation)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def _generation(namespace: str) -> tuple[int, int]:
+    """Clear counters covering a namespace; call with _lock held."""
+    return _generations[None], _generations[namespace]
+
+
+def _store(key: tuple, value: Any, lifetime: float, generation: tuple[int, int]) -> None:
+    """Insert or replace an entry, then drop expired entries and trim to MAX_CACHE_ENTRIES."""
+    now = time.monotonic()
+    with _lock:
+        if _generation(key[0]) != generation:
+            return  # cleared while the value was being computed, so it may predate the change
+        _cache[key] = (now, now + lifetime, value)
+        _cache.move_to_end(key)
+        for expired in [k for k, (_, expires_at, _) in _cache.items() if expires_at <= now]:
+            del _cache[expired]
+        while len(_cache) > MAX_CACHE_ENTRIES:
+            _cache.popitem(last=False)
+
+
+def _schedule_refresh(
+    key: tuple, func: Callable, kwargs: dict, lifetime: float, generation: tuple[int, int],
+) -> None:
+    """Recompute a stale entry in a background thread, at most one refresh per key."""
+    with _lock:
+        if key in _refreshing:
+            return
+        _refreshing.add(key)
+    threading.Thread(target=_refresh, args=(key, func, kwargs, lifetime, generation), daemon=True).start()
+
+
+def _refresh(
+    key: tuple, func: Callable, kwargs: dict, lifetime: float, generation: tuple[int, int],
+) -> None:
+    from database.models import SessionLocal
+    db = SessionLocal()
+    try:
+        value = func(db=db, **kwargs)
+        _store(key, value, lifetime, generation)
+    except Exception as e:
+        logger.warning(f"Background cache refresh failed for {key[1]}: {e}")
+    finally:
+        db.close()
+        with _lock:
+            _refreshing.discard(key)
+
+
+def clear_cache(namespace: Optional[str] = None) -> None:
+    """
+    Drop cached entries for one namespace, or everything when namespace is None.
+
+    Refreshes already running for the cleared entries finish but do not store their result.
+    """
+    with _lock:
+        _generations[namespace] += 1
+        if namespace is None:
+            _cache.clear()
+        else:
+            for key in [k for k in _cache if k[0] == namespace]:
+                del _cache[key]
+
+
+def cache_control(value: str) -> Callable:
+    """Route dependency that sets a Cache-Control header on the response."""
+    def dependency(response: Response) -> None:
+        response.headers["Cache-Control"] = value
+
+    return dependency
@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.orm import Session
-from sqlalchemy import func, distinct
+from sqlalchemy import func, literal, select, union_all
 from typing import Optional
 from datetime import date
-from database.models import Promotion, get_db
+from database.models import Promotion, get_db, promotion_fts
+from api.cache import CATALOG_CACHE_CONTROL, cached, cache_control
 
 router = APIRouter(prefix="/api/promotions", tags=["promotions"])
 
@@ -12,6 +13,24 @@ ALLOWED_SORT_COLUMNS = {
     "week_date", "retailer", "vendor", "msrp", "ad_price", "discount",
     "discount_pct", "cycle", "sku", "form_factor", "lcd_size",
 }
+# ORDER BY expressions built once at import instead of getattr() per request
+_SORT_ASC = {name: getattr(Promotion, name).asc() for name in ALLOWED_SORT_COLUMNS}
+_SORT_DESC = {name: getattr(Promotion, name).desc() for name in ALLOWED_SORT_COLUMNS}
+
+_APPROVED = Promotion.review_status == "approved"
+
+# Trigram tokens are 3 characters; shorter terms fall back to ILIKE
+FTS_MIN_TERM_LENGTH = 3
+
+# Columns emitted by _serialize, in response order
+PROMO_COLUMNS = (
+    Promotion.id, Promotion.retailer, Promotion.vendor, Promotion.sku, Promotion.msrp,
+    Promotion.ad_price, Promotion.discount, Promotion.discount_pct, Promotion.cycle,
+    Promotion.week_date, Promotion.form_factor, Promotion.lcd_size, Promotion.resolution,
+    Promotion.touch, Promotion.os, Promotion.cpu, Promotion.gpu, Promotion.ram,
+    Promotion.storage, Promotion.notes, Promotion.promo_type, Promotion.review_status,
+)
+_PROMO_KEYS = tuple(col.key for col in PROMO_COLUMNS)
 
 
 @router.get("")
@@ -38,7 +57,8 @@ def list_promotions(
     if date_from and date_to and date_from > date_to:
         raise HTTPException(status_code=400, detail="date_from must be before date_to")
 
-    q = db.query(Promotion).filter(Promotion.review_status == "approved")
+    # Plain column rows skip ORM identity-map and attribute instrumentation overhead
+    q = db.query(*PROMO_COLUMNS, func.count().over().label("total")).filter(_APPROVED)
 
     if retailer:
         q = q.filter(Promotion.retailer == retailer)
@@ -54,7 +74,12 @@ def list_promotions(
         q = q.filter(Promotion.form_factor == form_factor)
     if lcd_size:
         q = q.filter(Promotion.lcd_size == lcd_size)
-    if search:
+    if search and len(search) >= FTS_MIN_TERM_LENGTH:
+        # Trigram FTS gives the same case-insensitive substring match from an index
+        q = q.filter(Promotion.id.in_(
+            select(promotion_fts.c.rowid).where(promotion_fts.c.promotion_fts.match(_fts_phrase(search)))
+        ))
+    elif search:
         # [FIX] Escape SQL LIKE wildcards (% and _) in user search input
         safe_search = search.replace("%", r"\%").replace("_", r"\_")
         q = q.filter(
@@ -66,72 +91,70 @@ def list_promotions(
         q = q.filter(Promotion.week_date >= date_from)
     if date_to:
         q = q.filter(Promotion.week_date <= date_to)
-    sort_col = getattr(Promotion, sort_by)
-    if sort_dir not in ("asc", "desc"):
-        sort_dir = "desc"
-    q = q.order_by(sort_col.asc() if sort_dir == "asc" else sort_col.desc())
+    q = q.order_by(_SORT_ASC[sort_by] if sort_dir == "asc" else _SORT_DESC[sort_by])
 
-    total = q.count()
-    items = q.offset((page - 1) * per_page).limit(per_page).all()
+    # Window count returns the filtered total alongside the page in one query
+    offset = (page - 1) * per_page
+    rows = q.offset(offset).limit(per_page).all()
+    if rows:
+        total = rows[0].total
+    else:
+        # Past the last page the window has no rows to report on
+        total = q.count() if offset else 0
 
     return {
         "total": total,
         "page": page,
         "per_page": per_page,
         "pages": max((total + per_page - 1) // per_page, 1),
-        "items": [_serialize(p) for p in items],
+        "items": [_serialize(r) for r in rows],
     }
 
 
-@router.get("/filters")
+_FILTER_COLUMNS = [
+    ("retailers", Promotion.retailer),
+    ("vendors", Promotion.vendor),
+    ("cycles", Promotion.cycle),
+    ("form_factors", Promotion.form_factor),
+    ("lcd_sizes", Promotion.lcd_size),
+]
+
+# One UNION ALL over the approved rows instead of a DISTINCT query per column
+_FILTER_OPTIONS_STMT = union_all(*[
+    select(literal(key).label("key"), col.label("value"))
+    .where(_APPROVED)
+    .distinct()
+    for key, col in _FILTER_COLUMNS
+])
+
+
+@router.get("/filters", dependencies=[Depends(cache_control(CATALOG_CACHE_CONTROL))])
+@cached("analytics")
 def get_filter_options(db: Session = Depends(get_db)):
     # [FIX] Filter by approved status consistently with data endpoints
-    approved = Promotion.review_status == "approved"
-    retailers = [r[0] for r in db.query(distinct(Promotion.retailer)).filter(approved).order_by(Promotion.retailer).all()]
-    vendors = [v[0] for v in db.query(distinct(Promotion.vendor)).filter(approved).order_by(Promotion.vendor).all()]
-    cycles = [c[0] for c in db.query(distinct(Promotion.cycle)).filter(approved, Promotion.cycle.isnot(None)).order_by(Promotion.cycle).all()]
-    form_factors = [f[0] for f in db.query(distinct(Promotion.form_factor)).filter(approved, Promotion.form_factor.isnot(None)).order_by(Promotion.form_factor).all()]
-    lcd_sizes = [l[0] for l in db.query(distinct(Promotion.lcd_size)).filter(approved, Promotion.lcd_size.isnot(None)).order_by(Promotion.lcd_size).all()]
-    return {
-        "retailers": retailers,
-        "vendors": vendors,
-        "cycles": cycles,
-        "form_factors": form_factors,
-        "lcd_sizes": lcd_sizes,
-    }
+    options = {key: [] for key, _ in _FILTER_COLUMNS}
+    for key, value in db.execute(_FILTER_OPTIONS_STMT):
+        if value is not None:
+            options[key].append(value)
+    for values in options.values():
+        values.sort()
+    return options
 
 
 # [FIX] Use HTTPException instead of tuple return
 @router.get("/{promotion_id}")
 def get_promotion(promotion_id: int, db: Session = Depends(get_db)):
-    p = db.query(Promotion).filter(Promotion.id == promotion_id).first()
-    if not p:
+    row = db.query(*PROMO_COLUMNS).filter(Promotion.id == promotion_id).first()
+    if not row:
         raise HTTPException(status_code=404, detail="Promotion not found")
-    return _serialize(p)
+    return _serialize(row)
 
 
-def _serialize(p: Promotion) -> dict:
-    return {
-        "id": p.id,
-        "retailer": p.retailer,
-        "vendor": p.vendor,
-        "sku": p.sku,
-        "msrp": p.msrp,
-        "ad_price": p.ad_price,
-        "discount": p.discount,
-        "discount_pct": p.discount_pct,
-        "cycle": p.cycle,
-        "week_date": p.week_date.isoformat() if p.week_date else None,
-        "form_factor": p.form_factor,
-        "lcd_size": p.lcd_size,
-        "resolution": p.resolution,
-        "touch": p.touch,
-        "os": p.os,
-        "cpu": p.cpu,
-        "gpu": p.gpu,
-        "ram": p.ram,
-        "storage": p.storage,
-        "notes": p.notes,
-        "promo_type": p.promo_type,
-        "review_status": p.review_status,
-    }
+def _fts_phrase(term: str) -> str:
+    """Quote a user search term as a single FTS5 phrase so its syntax is not interpreted."""
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _serialize(row) -> dict:
+    """Build the response dict from a row selected with PROMO_COLUMNS (dates are encoded by orjson)."""
+    return dict(zip(_PROMO_KEYS, row))
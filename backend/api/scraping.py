@@ -3,18 +3,22 @@
 import logging
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query, Request, Response
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.orm import Session, raiseload
 
+from api.cache import CATALOG_CACHE_CONTROL, cached, cache_control, clear_cache
 from database.models import ScrapeRun, Retailer, get_db
 from scrapers.manager import run_scrape, get_scrape_status, claim_scrape_lock, release_scrape_lock
-from scrapers.utils.storage import list_screenshots, get_screenshot_filepath
+from scrapers.utils.storage import SCREENSHOT_MEDIA_TYPES, list_screenshots, get_screenshot_filepath
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api", tags=["scraping"])
 
+SCREENSHOT_CACHE_CONTROL = "public, max-age=604800, stale-while-revalidate=86400, immutable"
+
 
 # ---------- Request/Response models ----------
 
@@ -36,6 +40,7 @@ async def _background_scrape(retailer_slug: str, trigger_type: str):
         release_scrape_lock()  # Release lock on failure so future scrapes can proceed
     finally:
         db.close()
+        clear_cache("retailers")  # last_scraped may have changed
 
 
 # ---------- Endpoints ----------
@@ -88,7 +93,10 @@ def list_scrape_runs(
     db: Session = Depends(get_db),
 ):
     """List scrape runs with optional filters."""
-    q = db.query(ScrapeRun).order_by(ScrapeRun.started_at.desc())
+    q = db.query(ScrapeRun, func.count().over().label("total")).options(raiseload("*")).order_by(
+        # Runs created in one batch share a started_at second; newest id first breaks the tie
+        ScrapeRun.started_at.desc(), ScrapeRun.id.desc()
+    )
 
     if retailer:
         q = q.filter(ScrapeRun.retailer == retailer)
@@ -97,8 +105,13 @@ def list_scrape_runs(
             raise HTTPException(status_code=400, detail="Invalid status filter")
         q = q.filter(ScrapeRun.status == status)
 
-    total = q.count()
-    runs = q.offset(offset).limit(limit).all()
+    # Window count returns the filtered total alongside the page in one query
+    rows = q.offset(offset).limit(limit).all()
+    if rows:
+        total = rows[0].total
+    else:
+        total = q.count() if offset else 0
+    runs = [r.ScrapeRun for r in rows]
 
     return {
         "total": total,
@@ -111,7 +124,7 @@ def list_scrape_runs(
 @router.get("/scrape/runs/{run_id}")
 def get_scrape_run(run_id: int, db: Session = Depends(get_db)):
     """Get details of a single scrape run."""
-    run = db.query(ScrapeRun).filter(ScrapeRun.id == run_id).first()
+    run = db.query(ScrapeRun).options(raiseload("*")).filter(ScrapeRun.id == run_id).first()
     if not run:
         raise HTTPException(status_code=404, detail=f"Scrape run #{run_id} not found")
     return _serialize_run(run)
@@ -121,26 +134,31 @@ def get_scrape_run(run_id: int, db: Session = Depends(get_db)):
 def get_screenshots(
     retailer: Optional[str] = Query(None, description="Filter by retailer slug"),
     date: Optional[str] = Query(None, description="Filter by date (YYYY-MM-DD)"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Return at most this many"),
 ):
     """List available screenshots with metadata."""
-    screenshots = list_screenshots(retailer_slug=retailer, scrape_date=date)
+    screenshots = list_screenshots(retailer_slug=retailer, scrape_date=date, limit=limit)
     return {"total": len(screenshots), "screenshots": screenshots}
 
 
 @router.get("/screenshots/{retailer}/{date}/{filename}")
-def serve_screenshot(retailer: str, date: str, filename: str):
-    """Serve a screenshot PNG file."""
+def serve_screenshot(retailer: str, date: str, filename: str, request: Request):
+    """Serve a screenshot image file, answering conditional requests with 304."""
     filepath = get_screenshot_filepath(retailer, date, filename)
     if not filepath:
         raise HTTPException(status_code=404, detail="Screenshot not found")
+    st = filepath.stat()
+    etag = f'"{int(st.st_mtime)}-{st.st_size}"'
+    headers = {"Cache-Control": SCREENSHOT_CACHE_CONTROL, "ETag": etag}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
     return FileResponse(
-        filepath,
-        media_type="image/png",
-        headers={"Cache-Control": "public, max-age=604800, immutable"},
+        filepath, stat_result=st, media_type=SCREENSHOT_MEDIA_TYPES.get(filepath.suffix, "image/png"), headers=headers,
     )
 
 
-@router.get("/retailers")
+@router.get("/retailers", dependencies=[Depends(cache_control(CATALOG_CACHE_CONTROL))])
+@cached("retailers", max_age=60)
 def list_retailers(db: Session = Depends(get_db)):
     """List all retailers with their scrape status."""
     retailers = db.query(Retailer).order_by(Retailer.name).all()
@@ -161,6 +179,14 @@ def list_retailers(db: Session = Depends(get_db)):
 
 # ---------- Helpers ----------
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header (weak comparison, may list several tags) against an ETag."""
+    if not if_none_match:
+        return False
+    tags = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
 def _serialize_run(run: ScrapeRun) -> dict:
     return {
         "id": run.id,
@@ -1,4 +1,6 @@
 import os
+import sys
+import types
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -7,6 +9,8 @@ DATA_DIR = WORK_DIR / "data"
 SCREENSHOTS_DIR = DATA_DIR / "screenshots"
 DB_PATH = DATA_DIR / "ecom-watch.db"
 DATABASE_URL = f"sqlite:///{DB_PATH}"
+# Compiled-SQL cache entries per engine; dynamic filter combinations need more than the default 500
+DB_QUERY_CACHE_SIZE = 1200
 DOCS_DIR = BASE_DIR / "docs"
 EXCEL_IMPORT_PATH = DOCS_DIR / "CAD Ad Tracking 2025 01252026.xlsx"
 OUTPUT_DIR = BASE_DIR  # mounted workspace folder for final outputs
@@ -14,7 +18,7 @@ OUTPUT_DIR = BASE_DIR  # mounted workspace folder for final outputs
 SCREENSHOTS_DIR.mkdir(parents=True, exist_ok=True)
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-CANONICAL_VENDORS = {
+_CANONICAL_VENDORS = {
     "acer": "Acer",
     "apple": "Apple",
     "asus": "ASUS",
@@ -30,6 +34,20 @@ CANONICAL_VENDORS = {
     "samsung": "Samsung",
     "other": "Other",
 }
+# str.translate table dropping Latin-1 punctuation and whitespace ("A.S.U.S." -> "ASUS")
+VENDOR_KEY_TABLE = {i: None for i in range(256) if not chr(i).isalnum()}
+
+
+def vendor_key(name: str) -> str:
+    """Lookup key for CANONICAL_VENDORS: casefolded with punctuation and spaces removed."""
+    return name.casefold().translate(VENDOR_KEY_TABLE)
+
+
+# Read-only view keyed by vendor_key(); look up with CANONICAL_VENDORS.get(vendor_key(name))
+CANONICAL_VENDORS = types.MappingProxyType(
+    {vendor_key(key): sys.intern(name) for key, name in _CANONICAL_VENDORS.items()}
+)
+
 
 CYCLE_DATE_RANGES = {
     "SPR": (1, 4),
@@ -1,10 +1,14 @@
-from datetime import datetime, date, timezone
+import sqlite3
+from contextlib import contextmanager
+from datetime import date
 from sqlalchemy import (
     Column, Integer, String, Float, Boolean, Date, DateTime, Text, ForeignKey,
-    create_engine, Index, JSON
+    create_engine, Index, JSON, DDL, event, func, text
 )
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql import column, table
 from sqlalchemy.orm import declarative_base, relationship, sessionmaker
-from config import DATABASE_URL
+from config import DATABASE_URL, DB_QUERY_CACHE_SIZE
 
 Base = declarative_base()
 
@@ -36,12 +40,18 @@ class Promotion(Base):
     source_url = Column(Text)
     scrape_run_id = Column(Integer, ForeignKey("scrape_runs.id"), nullable=True)
     review_status = Column(String(20), default="approved")
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
-    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime, default=func.now())
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
 
     __table_args__ = (
         Index("ix_promotions_retailer_week", "retailer", "week_date"),
         Index("ix_promotions_vendor_cycle", "vendor", "cycle"),
+        # Covers the approved-only filters/groupings used by the analytics and list endpoints
+        Index("ix_promo_approved_cover", "review_status", "cycle", "retailer", "vendor", "ad_price", "week_date"),
+        Index(
+            "ix_promo_approved_only", "retailer", "vendor", "cycle",
+            sqlite_where=text("review_status = 'approved'"),
+        ),
     )
 
 
@@ -50,7 +60,7 @@ class ScrapeRun(Base):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     retailer = Column(String(100), nullable=False)
-    started_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    started_at = Column(DateTime, default=func.now())
     completed_at = Column(DateTime, nullable=True)
     status = Column(String(20), default="running")
     screenshot_path = Column(Text, nullable=True)
@@ -85,7 +95,7 @@ class Alert(Base):
     description = Column(Text)
     retailer = Column(String(100), nullable=True)
     promotion_id = Column(Integer, ForeignKey("promotions.id"), nullable=True)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime, default=func.now())
     read = Column(Boolean, default=False)
 
 
@@ -109,15 +119,196 @@ class ImportAuditLog(Base):
     field_name = Column(String(50))
     original_value = Column(String(255))
     normalized_value = Column(String(255))
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime, default=func.now())
 
 
-engine = create_engine(DATABASE_URL, echo=False)
+class PromotionSummary(Base):
+    """
+    Pre-aggregated approved promotions per (cycle, retailer, vendor).
+
+    Maintained by SQLite triggers on the promotions table (each write recomputes only
+    the affected groups) and rebuilt in full by refresh_promotion_summary() on startup.
+    Means are derived as sum / count so groups can be rolled up further.
+    """
+    __tablename__ = "promotion_summary"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    cycle = Column(String(20))
+    retailer = Column(String(100), nullable=False)
+    vendor = Column(String(100), nullable=False)
+    promo_count = Column(Integer, nullable=False, default=0)
+    price_count = Column(Integer, nullable=False, default=0)
+    price_sum = Column(Float, nullable=False, default=0.0)
+    price_min = Column(Float)
+    price_max = Column(Float)
+    discount_pct_count = Column(Integer, nullable=False, default=0)
+    discount_pct_sum = Column(Float, nullable=False, default=0.0)
+    # Rows that have a discount_pct, used by discount trends
+    discounted_price_count = Column(Integer, nullable=False, default=0)
+    discounted_price_sum = Column(Float, nullable=False, default=0.0)
+    discounted_dollars_count = Column(Integer, nullable=False, default=0)
+    discounted_dollars_sum = Column(Float, nullable=False, default=0.0)
+
+    __table_args__ = (
+        Index("ix_promotion_summary_key", "cycle", "retailer", "vendor"),
+    )
+
+
+_SUMMARY_SELECT = """
+    SELECT cycle, retailer, vendor,
+           COUNT(*), COUNT(ad_price), TOTAL(ad_price), MIN(ad_price), MAX(ad_price),
+           COUNT(discount_pct), TOTAL(discount_pct),
+           COUNT(CASE WHEN discount_pct IS NOT NULL THEN ad_price END),
+           TOTAL(CASE WHEN discount_pct IS NOT NULL THEN ad_price END),
+           COUNT(CASE WHEN discount_pct IS NOT NULL THEN discount END),
+           TOTAL(CASE WHEN discount_pct IS NOT NULL THEN discount END)
+    FROM promotions
+    WHERE review_status = 'approved'{where}
+    GROUP BY cycle, retailer, vendor
+"""
+_SUMMARY_INSERT = """
+    INSERT INTO promotion_summary (
+        cycle, retailer, vendor, promo_count, price_count, price_sum, price_min, price_max,
+        discount_pct_count, discount_pct_sum, discounted_price_count, discounted_price_sum,
+        discounted_dollars_count, discounted_dollars_sum
+    )"""
+
+
+def _summary_group_refresh(row: str) -> str:
+    """Trigger statements recomputing the summary group of NEW or OLD."""
+    match = f"cycle IS {row}.cycle AND retailer = {row}.retailer AND vendor = {row}.vendor"
+    return (
+        f"DELETE FROM promotion_summary WHERE {match};"
+        + _SUMMARY_INSERT
+        + _SUMMARY_SELECT.format(where=f" AND {match}")
+        + ";"
+    )
+
+
+_SUMMARY_TRIGGERS = [
+    f"""CREATE TRIGGER IF NOT EXISTS trg_promotion_summary_insert AFTER INSERT ON promotions
+    BEGIN {_summary_group_refresh("NEW")} END""",
+    f"""CREATE TRIGGER IF NOT EXISTS trg_promotion_summary_delete AFTER DELETE ON promotions
+    BEGIN {_summary_group_refresh("OLD")} END""",
+    f"""CREATE TRIGGER IF NOT EXISTS trg_promotion_summary_update
+    AFTER UPDATE OF retailer, vendor, cycle, ad_price, discount, discount_pct, review_status ON promotions
+    BEGIN {_summary_group_refresh("OLD")} {_summary_group_refresh("NEW")} END""",
+]
+
+# Trigram FTS5 index over the searchable promotion text. External-content, so it
+# stores only the index and triggers keep it in sync with promotions.
+_FTS_COLUMNS = "sku, cpu, notes"
+_FTS_DDL = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS promotion_fts USING fts5(
+        {_FTS_COLUMNS}, content='promotions', content_rowid='id', tokenize='trigram'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS trg_promotion_fts_insert AFTER INSERT ON promotions
+    BEGIN
+        INSERT INTO promotion_fts (rowid, {_FTS_COLUMNS}) VALUES (NEW.id, NEW.sku, NEW.cpu, NEW.notes);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS trg_promotion_fts_delete AFTER DELETE ON promotions
+    BEGIN
+        INSERT INTO promotion_fts (promotion_fts, rowid, {_FTS_COLUMNS})
+        VALUES ('delete', OLD.id, OLD.sku, OLD.cpu, OLD.notes);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS trg_promotion_fts_update AFTER UPDATE OF sku, cpu, notes ON promotions
+    BEGIN
+        INSERT INTO promotion_fts (promotion_fts, rowid, {_FTS_COLUMNS})
+        VALUES ('delete', OLD.id, OLD.sku, OLD.cpu, OLD.notes);
+        INSERT INTO promotion_fts (rowid, {_FTS_COLUMNS}) VALUES (NEW.id, NEW.sku, NEW.cpu, NEW.notes);
+    END""",
+]
+
+# Query handle for the FTS table (not part of Base.metadata; created by the DDL above)
+promotion_fts = table("promotion_fts", column("rowid"), column("promotion_fts"))
+
+# Attached to the metadata so they run once both tables exist
+for _ddl in _SUMMARY_TRIGGERS + _FTS_DDL:
+    event.listen(Base.metadata, "after_create", DDL(_ddl).execute_if(dialect="sqlite"))
+
+
+# WAL lets analytics reads proceed while a scrape or import is writing
+_SQLITE_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA cache_size=-65536;
+    PRAGMA mmap_size=268435456;
+    PRAGMA temp_store=MEMORY;
+"""
+
+
+@event.listens_for(Engine, "connect")
+def _set_sqlite_pragmas(dbapi_conn, _connection_record):
+    if not isinstance(dbapi_conn, sqlite3.Connection):
+        return
+    cursor = dbapi_conn.cursor()
+    cursor.executescript(_SQLITE_PRAGMAS)
+    cursor.close()
+
+
+engine = create_engine(
+    DATABASE_URL,
+    echo=False,
+    query_cache_size=DB_QUERY_CACHE_SIZE,
+    insertmanyvalues_page_size=1000,
+)
 SessionLocal = sessionmaker(bind=engine)
 
 
 def init_db():
     Base.metadata.create_all(engine)
+    # create_all skips indexes on tables that already exist; add any that are new
+    for tbl in Base.metadata.sorted_tables:
+        for index in tbl.indexes:
+            index.create(engine, checkfirst=True)
+    refresh_promotion_summary()
+    rebuild_search_index()
+
+
+def refresh_promotion_summary(conn=None):
+    """Rebuild promotion_summary from scratch (triggers keep it current afterwards)."""
+    if conn is None:
+        with engine.begin() as conn:
+            return refresh_promotion_summary(conn)
+    conn.execute(text("DELETE FROM promotion_summary"))
+    conn.execute(text(_SUMMARY_INSERT + _SUMMARY_SELECT.format(where="")))
+
+
+def rebuild_search_index(conn=None):
+    """Repopulate promotion_fts from promotions (triggers keep it current afterwards)."""
+    if conn is None:
+        with engine.begin() as conn:
+            return rebuild_search_index(conn)
+    conn.execute(text("INSERT INTO promotion_fts (promotion_fts) VALUES ('rebuild')"))
+
+
+_PROMOTION_TRIGGERS = [
+    "trg_promotion_summary_insert", "trg_promotion_summary_delete", "trg_promotion_summary_update",
+    "trg_promotion_fts_insert", "trg_promotion_fts_delete", "trg_promotion_fts_update",
+]
+
+
+@contextmanager
+def deferred_promotion_maintenance(conn):
+    """
+    Bulk-load promotions without per-row index and trigger upkeep.
+
+    Drops the promotions indexes and the summary/search triggers for the duration of the
+    block, then recreates the indexes (one sorted build each), the triggers, and rebuilds
+    promotion_summary and promotion_fts once. Run inside the loading transaction.
+    """
+    indexes = list(Promotion.__table__.indexes)
+    for name in _PROMOTION_TRIGGERS:
+        conn.execute(text(f"DROP TRIGGER IF EXISTS {name}"))
+    for index in indexes:
+        index.drop(conn, checkfirst=True)
+    yield
+    for index in indexes:
+        index.create(conn, checkfirst=True)
+    for ddl in _SUMMARY_TRIGGERS + _FTS_DDL:
+        conn.execute(text(ddl))
+    refresh_promotion_summary(conn)
+    rebuild_search_index(conn)
 
 
 def get_db():
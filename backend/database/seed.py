@@ -2,20 +2,24 @@
 import sys
 import os
 import logging
+import re
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import pandas as pd
-from datetime import datetime
-from sqlalchemy import text
+from sqlalchemy import desc, func, insert, literal, select, text, union_all
 from database.models import (
-    Promotion, Retailer, Cycle, ImportAuditLog, init_db, engine, SessionLocal
+    Promotion, Retailer, Cycle, ImportAuditLog, init_db, engine,
+    deferred_promotion_maintenance,
 )
-from config import EXCEL_IMPORT_PATH, CANONICAL_VENDORS
+from config import EXCEL_IMPORT_PATH, CANONICAL_VENDORS, vendor_key
 
 # [FIX] Add logging instead of silently swallowing errors
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Promotions inserted per executemany batch during the import
+IMPORT_CHUNK_SIZE = 10_000
+
 DEFAULT_RETAILERS = [
     {"name": "Best Buy", "slug": "bestbuy", "base_url": "https://www.bestbuy.ca/en-ca/collection/top-deals-laptops/36582"},
     {"name": "Staples", "slug": "staples", "base_url": "https://www.staples.ca/a/content/flyers"},
@@ -28,43 +32,50 @@ DEFAULT_RETAILERS = [
 ]
 
 
-def normalize_vendor(raw_vendor: str) -> tuple[str, bool]:
-    if not raw_vendor:
-        return "Other", True
-    key = raw_vendor.strip().lower()
-    if key in CANONICAL_VENDORS:
-        canonical = CANONICAL_VENDORS[key]
-        changed = canonical != raw_vendor.strip()
-        return canonical, changed
-    return raw_vendor.strip(), False
+def normalize_vendor(raw_vendor: str) -> str:
+    """Canonical spelling of a vendor; unknown names are kept as-is and blanks become "Other"."""
+    stripped = (raw_vendor or "").strip()
+    return CANONICAL_VENDORS.get(vendor_key(stripped), stripped or "Other")
+
+
+# Season prefix, then the year with any spaces/apostrophes around it: "BTS 21", "HOL'25", "spr 2024"
+_CYCLE_RE = re.compile(r"(SPR|BTS|HOL)[\s']*(\d+)[\s']*", re.IGNORECASE)
+_SEASON_META = {
+    "SPR": ("Spring", "spring"),
+    "BTS": ("Back-to-School", "bts"),
+    "HOL": ("Holiday", "holiday"),
+}
 
 
 def parse_cycle_info(code: str) -> dict:
     if not code:
         return None
     code = code.strip()
-    season_map = {
-        "SPR": ("Spring", "spring"),
-        "BTS": ("Back-to-School", "bts"),
-        "HOL": ("Holiday", "holiday"),
-    }
-    for prefix, (full_name, season) in season_map.items():
-        if code.upper().startswith(prefix):
-            year_part = code[len(prefix):].strip().strip("'").strip()
-            if year_part:
-                try:
-                    year = int(year_part)
-                    if year < 100:
-                        year += 2000
-                    return {"code": code, "name": f"{full_name} {year}", "season": season, "year": year}
-                except ValueError:
-                    pass
-    return None
+    match = _CYCLE_RE.fullmatch(code)
+    if not match:
+        return None
+    full_name, season = _SEASON_META[match.group(1).upper()]
+    year = int(match.group(2))
+    if year < 100:
+        year += 2000
+    return {"code": code, "name": f"{full_name} {year}", "season": season, "year": year}
+
+
+TEXT_COLUMNS = [
+    "retailer", "vendor", "sku", "cycle", "form_factor", "lcd", "resolution", "touch",
+    "os", "cpu", "gpu", "ram", "storage", "other",
+]
+
+
+def _clean_text(column: pd.Series) -> pd.Series:
+    """Stringify and strip every present cell of a column; missing cells stay NA."""
+    return column.astype("string").str.strip()
 
 
 def import_excel():
     print(f"Reading Excel file: {EXCEL_IMPORT_PATH}")
-    df = pd.read_excel(EXCEL_IMPORT_PATH, sheet_name="Laptops", header=3)
+    # calamine (Rust) parses the workbook several times faster than openpyxl with identical cell values
+    df = pd.read_excel(EXCEL_IMPORT_PATH, sheet_name="Laptops", header=3, engine="calamine")
     df.columns = [
         "retailer", "vendor", "sku", "msrp", "ad_price", "discount",
         "cycle", "week", "form_factor", "lcd", "resolution", "touch",
@@ -73,154 +84,134 @@ def import_excel():
     df = df.dropna(subset=["retailer"])
     print(f"Found {len(df)} rows to import")
 
+    # Vectorized cleaning: each column is processed as a whole instead of per row
+    # Excel row = DataFrame index + 5 to account for the header offset
+    cleaned = {col: _clean_text(df[col]) for col in TEXT_COLUMNS}
+
+    # Normalize vendor
+    # Only a few dozen distinct spellings exist, so normalize each once and map the column
+    raw_vendor = cleaned["vendor"].fillna("")
+    canonical_vendor = raw_vendor.map({raw: normalize_vendor(raw) for raw in raw_vendor.unique()})
+    changed = (canonical_vendor != raw_vendor) & (raw_vendor != "")
+    audit_logs = [
+        {
+            "excel_row": int(idx) + 5,
+            "field_name": "vendor",
+            "original_value": original,
+            "normalized_value": canonical_vendor[idx],
+        }
+        for idx, original in raw_vendor[changed].items()
+    ]
+
+    # Track cycles: parse each distinct code once, in order of first appearance
+    cycles = [info for code in cleaned["cycle"].dropna().unique() if (info := parse_cycle_info(code))]
+
+    # Parse week date
+    week = pd.to_datetime(df["week"], errors="coerce")
+    # [FIX] Log date parse failures instead of silently skipping
+    for excel_row, value in df["week"][week.isna() & df["week"].notna()].items():
+        logger.warning(f"Row {excel_row + 5}: Could not parse date '{value}'")
+
+    # Calculate discount percentage
+    msrp = df["msrp"].where(df["msrp"] != 0)
+    # Python's round() keeps the exact decimal rounding numpy's .round() can miss
+    discount_pct = (df["discount"] / msrp * 100).where(df["discount"] != 0).map(
+        lambda pct: round(pct, 1), na_action="ignore"
+    )
+    # [FIX] Cap discount_pct at 100% to prevent nonsensical values
+    for excel_row, pct in discount_pct[discount_pct > 100].items():
+        logger.warning(f"Row {excel_row + 5}: Discount {pct}% exceeds 100%, capping")
+    for excel_row, pct in discount_pct[discount_pct < 0].items():
+        logger.warning(f"Row {excel_row + 5}: Negative discount {pct}%, setting to 0")
+    discount_pct = discount_pct.clip(0, 100)
+
+    frame = pd.DataFrame({
+        "retailer": cleaned["retailer"],
+        "vendor": canonical_vendor,
+        "sku": cleaned["sku"].fillna(""),
+        "msrp": msrp,
+        "ad_price": df["ad_price"],
+        "discount": df["discount"],
+        "discount_pct": discount_pct,
+        "cycle": cleaned["cycle"],
+        "week_date": week.dt.date,
+        "form_factor": cleaned["form_factor"],
+        "lcd_size": cleaned["lcd"],
+        "resolution": cleaned["resolution"],
+        "touch": cleaned["touch"],
+        "os": cleaned["os"],
+        "cpu": cleaned["cpu"],
+        "gpu": cleaned["gpu"],
+        "ram": cleaned["ram"],
+        "storage": cleaned["storage"],
+        "notes": cleaned["other"],
+        "review_status": "approved",
+    })
+    # NaN/NaT -> None so the driver stores NULL
+    frame = frame.astype(object).where(frame.notna(), None)
+
     init_db()
-    session = SessionLocal()
-
-    # Clear existing data for fresh import
-    session.execute(text("DELETE FROM promotions"))
-    session.execute(text("DELETE FROM import_audit_log"))
-    session.execute(text("DELETE FROM cycles"))
-    session.execute(text("DELETE FROM retailers"))
-    session.commit()
-
-    # Seed retailers
-    for r in DEFAULT_RETAILERS:
-        session.add(Retailer(**r))
-    session.commit()
-    print(f"Seeded {len(DEFAULT_RETAILERS)} retailers")
-
-    # Track cycles
-    seen_cycles = {}
-    audit_logs = []
-    promotions = []
-
-    for idx, row in df.iterrows():
-        excel_row = idx + 5  # account for header offset
-
-        # Normalize vendor
-        raw_vendor = str(row["vendor"]).strip() if pd.notna(row["vendor"]) else ""
-        canonical_vendor, changed = normalize_vendor(raw_vendor)
-        if changed and raw_vendor:
-            audit_logs.append(ImportAuditLog(
-                excel_row=excel_row,
-                field_name="vendor",
-                original_value=raw_vendor,
-                normalized_value=canonical_vendor,
-            ))
-
-        # Parse cycle
-        cycle_str = str(row["cycle"]).strip() if pd.notna(row["cycle"]) else None
-        if cycle_str and cycle_str not in seen_cycles:
-            info = parse_cycle_info(cycle_str)
-            if info:
-                seen_cycles[cycle_str] = info
-
-        # Parse week date
-        week_date = None
-        if pd.notna(row["week"]):
-            if isinstance(row["week"], datetime):
-                week_date = row["week"].date()
-            else:
-                try:
-                    week_date = pd.to_datetime(row["week"]).date()
-                except Exception:
-                    # [FIX] Log date parse failures instead of silently skipping
-                    logger.warning(f"Row {excel_row}: Could not parse date '{row['week']}'")
-
-        # Calculate discount percentage
-        discount_pct = None
-        msrp = float(row["msrp"]) if pd.notna(row["msrp"]) and row["msrp"] != 0 else None
-        ad_price = float(row["ad_price"]) if pd.notna(row["ad_price"]) else None
-        discount = float(row["discount"]) if pd.notna(row["discount"]) else None
-        if msrp and discount:
-            discount_pct = round((discount / msrp) * 100, 1)
-            # [FIX] Cap discount_pct at 100% to prevent nonsensical values
-            if discount_pct > 100:
-                logger.warning(f"Row {excel_row}: Discount {discount_pct}% exceeds 100%, capping")
-                discount_pct = 100.0
-            elif discount_pct < 0:
-                logger.warning(f"Row {excel_row}: Negative discount {discount_pct}%, setting to 0")
-                discount_pct = 0.0
-
-        # Parse touch
-        touch_val = str(row["touch"]).strip() if pd.notna(row["touch"]) else None
-
-        promotions.append(Promotion(
-            retailer=str(row["retailer"]).strip(),
-            vendor=canonical_vendor,
-            sku=str(row["sku"]).strip() if pd.notna(row["sku"]) else "",
-            msrp=msrp,
-            ad_price=ad_price,
-            discount=discount,
-            discount_pct=discount_pct,
-            cycle=cycle_str,
-            week_date=week_date,
-            form_factor=str(row["form_factor"]).strip() if pd.notna(row["form_factor"]) else None,
-            lcd_size=str(row["lcd"]).strip() if pd.notna(row["lcd"]) else None,
-            resolution=str(row["resolution"]).strip() if pd.notna(row["resolution"]) else None,
-            touch=touch_val,
-            os=str(row["os"]).strip() if pd.notna(row["os"]) else None,
-            cpu=str(row["cpu"]).strip() if pd.notna(row["cpu"]) else None,
-            gpu=str(row["gpu"]).strip() if pd.notna(row["gpu"]) else None,
-            ram=str(row["ram"]).strip() if pd.notna(row["ram"]) else None,
-            storage=str(row["storage"]).strip() if pd.notna(row["storage"]) else None,
-            notes=str(row["other"]).strip() if pd.notna(row["other"]) else None,
-            review_status="approved",
-        ))
 
     # [FIX] Wrap bulk operations in try/except with rollback
+    # One transaction for the whole import; Core executemany inserts skip ORM objects entirely
     try:
-        # Bulk insert promotions
-        session.bulk_save_objects(promotions)
-        print(f"Imported {len(promotions)} promotions")
-
-        # Insert audit logs
-        session.bulk_save_objects(audit_logs)
-        print(f"Recorded {len(audit_logs)} normalization changes in audit log")
-
-        # Insert cycles
-        for code, info in seen_cycles.items():
-            session.add(Cycle(**info))
-        print(f"Created {len(seen_cycles)} cycle records")
-
-        session.commit()
+        with engine.begin() as conn:
+            # Load promotions with indexes/triggers deferred; they are rebuilt once at the end
+            with deferred_promotion_maintenance(conn):
+                # Clear existing data for fresh import
+                conn.execute(text("DELETE FROM promotions"))
+                conn.execute(text("DELETE FROM import_audit_log"))
+                conn.execute(text("DELETE FROM cycles"))
+                conn.execute(text("DELETE FROM retailers"))
+
+                conn.execute(insert(Retailer), DEFAULT_RETAILERS)
+                print(f"Seeded {len(DEFAULT_RETAILERS)} retailers")
+
+                # Row dicts are built one chunk at a time so only a chunk's worth is alive at once
+                for start in range(0, len(frame), IMPORT_CHUNK_SIZE):
+                    chunk = frame.iloc[start:start + IMPORT_CHUNK_SIZE]
+                    conn.execute(insert(Promotion), chunk.to_dict(orient="records"))
+                print(f"Imported {len(frame)} promotions")
+
+            if audit_logs:
+                conn.execute(insert(ImportAuditLog), audit_logs)
+            print(f"Recorded {len(audit_logs)} normalization changes in audit log")
+
+            if cycles:
+                conn.execute(insert(Cycle), cycles)
+            print(f"Created {len(cycles)} cycle records")
     except Exception as e:
-        session.rollback()
         logger.error(f"Import failed, rolling back: {e}")
         raise
-    finally:
-        # [FIX] Single close in finally block handles both success and error paths
-        session.close()
 
     # Print summary
     print("\n--- Import Summary ---")
-    session = SessionLocal()
-    from sqlalchemy import func
-    vendor_counts = session.query(
-        Promotion.vendor, func.count(Promotion.id)
-    ).group_by(Promotion.vendor).order_by(func.count(Promotion.id).desc()).all()
+    # Both breakdowns in one round trip; rows are tagged with the column they group by
+    breakdown = union_all(
+        select(literal("vendor"), Promotion.vendor, func.count().label("count")).group_by(Promotion.vendor),
+        select(literal("retailer"), Promotion.retailer, func.count()).group_by(Promotion.retailer),
+    ).order_by(desc("count"))
+    counts = {"vendor": [], "retailer": []}
+    with engine.connect() as conn:
+        for kind, name, count in conn.execute(breakdown):
+            counts[kind].append((name, count))
+
     print("\nPromotions by vendor:")
-    for vendor, count in vendor_counts:
+    for vendor, count in counts["vendor"]:
         print(f"  {vendor}: {count}")
 
-    retailer_counts = session.query(
-        Promotion.retailer, func.count(Promotion.id)
-    ).group_by(Promotion.retailer).order_by(func.count(Promotion.id).desc()).all()
     print("\nPromotions by retailer:")
-    for retailer, count in retailer_counts:
+    for retailer, count in counts["retailer"]:
         print(f"  {retailer}: {count}")
 
-    audit_count = session.query(ImportAuditLog).count()
-    print(f"\nVendor normalizations logged: {audit_count}")
+    print(f"\nVendor normalizations logged: {len(audit_logs)}")
 
     # Show some examples of normalizations
-    samples = session.query(ImportAuditLog).limit(10).all()
-    if samples:
+    if audit_logs:
         print("\nSample normalizations:")
-        for s in samples:
-            print(f"  Row {s.excel_row}: '{s.original_value}' → '{s.normalized_value}'")
+        for log in audit_logs[:10]:
+            print(f"  Row {log['excel_row']}: '{log['original_value']}' → '{log['normalized_value']}'")
 
-    session.close()
     print("\nImport complete!")
 
 
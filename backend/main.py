@@ -5,20 +5,41 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from database.models import init_db
 from api.promotions import router as promotions_router
 from api.analytics import router as analytics_router
 from api.scraping import router as scraping_router
+from scrapers.browser_pool import browser_pool
+from scrapers.retailers import validate_registry
 
 
 # [FIX] Replace deprecated @app.on_event("startup") with lifespan context manager
 @asynccontextmanager
 async def lifespan(app):
     init_db()
+    # Catch enabled retailers without a scraper at startup rather than mid-run
+    from database.models import SessionLocal
+    with SessionLocal() as db:
+        validate_registry(db)
     yield
+    await browser_pool.shutdown()
 
 
-app = FastAPI(title="Ecom-Watch", version="0.2.0", lifespan=lifespan)
+class JSONGZipMiddleware(GZipMiddleware):
+    """GZip API responses, but pass screenshot files through (PNGs are already compressed)."""
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith("/api/screenshots/"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+app = FastAPI(title="Ecom-Watch", version="0.2.0", lifespan=lifespan, default_response_class=ORJSONResponse)
+
+app.add_middleware(JSONGZipMiddleware, minimum_size=1024)
 
 # [FIX] CORS: restrict origins instead of wildcard; disable credentials with wildcard
 app.add_middleware(
@@ -41,4 +62,5 @@ def health():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("main:app", host="127.0.0.1", port=8000, reload=True)
+    # loop="auto" runs on uvloop where it is installed (see requirements.txt), asyncio otherwise
+    uvicorn.run("main:app", host="127.0.0.1", port=8000, reload=True, loop="auto")
@@ -1,22 +1,70 @@
 """Base scraper class providing Playwright browser automation, screenshot capture, and error handling."""
 
 import asyncio
+import gzip
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Optional
+from urllib.parse import urlsplit
 
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page, TimeoutError as PlaywrightTimeout
+from playwright.async_api import Browser, BrowserContext, Locator, Page, Route, TimeoutError as PlaywrightTimeout
+
+from scrapers.browser_pool import browser_pool
+from scrapers.rate_limiter import host_limiter
+from scrapers.utils.storage import delete_stored_file, new_screenshot_path, storage_relative_path
 
 logger = logging.getLogger(__name__)
 
 USER_AGENT = "Ecom-Watch/0.2.0 (Laptop price monitoring for internal competitive analysis)"
 NAV_TIMEOUT_MS = 30_000
-PAGE_LOAD_TIMEOUT_MS = 60_000
+# Pages that haven't reached DOMContentLoaded by then are hung; failing sooner lets the retry start
+PAGE_LOAD_TIMEOUT_MS = 30_000
+# How long navigate_to_deals waits for a retailer's product listing to render
+LISTING_TIMEOUT_MS = 15_000
+# Minimum spacing between requests to the same host
 RATE_LIMIT_SECONDS = 5
+# Longest wait for the load event after navigation
+SETTLE_TIMEOUT_MS = 5_000
 MAX_RETRIES = 3
 RETRY_BACKOFF = [1, 2, 4]
 MAX_SCROLL_ITERATIONS = 50
+# Requests the capture doesn't need. Images and stylesheets stay: every scrape ends in a screenshot
+BLOCKED_RESOURCE_TYPES = frozenset({"font", "media", "websocket"})
+# Analytics/tracking hosts (matched with their subdomains); they add requests but nothing to the capture
+BLOCKED_DOMAINS = (
+    "google-analytics.com", "doubleclick.net", "facebook.net", "hotjar.com",
+    "clarity.ms", "bat.bing.com", "analytics.tiktok.com", "criteo.com", "quantserve.com",
+)
+# Dismiss buttons for the cookie banners and modals most sites share
+COMMON_POPUP_SELECTORS = (
+    "button:has-text('Accept')",
+    "button:has-text('Accept All')",
+    "button:has-text('I Accept')",
+    "button:has-text('Got it')",
+    "button:has-text('Close')",
+    "[aria-label='Close']",
+    ".cookie-banner button",
+    "#onetrust-accept-btn-handler",
+)
+
+# Step down the page until the bottom is reached, pausing after each step so lazy content can
+# load and extend the page. Returns the number of steps taken and the final page height.
+SCROLL_JS = """
+async ({step, pauseMs, maxIterations}) => {
+    let height = document.body.scrollHeight;
+    let position = 0;
+    let iterations = 0;
+    while (position < height && iterations < maxIterations) {
+        position += step;
+        window.scrollTo(0, Math.floor(position));
+        await new Promise(resolve => setTimeout(resolve, pauseMs));
+        height = Math.max(height, document.body.scrollHeight);
+        iterations++;
+    }
+    return {iterations, height};
+}
+"""
 
 
 @dataclass
@@ -31,9 +79,8 @@ class ScrapeResult:
     error_message: Optional[str] = None
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
-    # Raw captured data — used by the manager to save via storage utils
-    screenshot_bytes: Optional[bytes] = None
-    html_content: Optional[str] = None
+    # Gzipped captured HTML — saved by the manager via storage utils (screenshots are written directly)
+    html_gzip: Optional[bytes] = None
 
 
 class BaseScraper:
@@ -46,51 +93,69 @@ class BaseScraper:
 
     Subclasses should override:
         navigate_to_deals(page) — navigate to the retailer's deals/promotions page
-        dismiss_popups(page)    — close cookie banners, modals, etc.
+        popup_selectors         — dismiss buttons for cookie banners, modals, etc.
         scroll_for_content(page) — scroll to load lazy content
     """
 
     retailer_slug: str = ""
     retailer_name: str = ""
+    # Dismiss buttons, one tuple of selectors per popup; subclasses replace or extend this
+    popup_selectors: tuple[tuple[str, ...], ...] = (COMMON_POPUP_SELECTORS,)
+    # Fixed for the life of each context, so scrolling reads it here, not from the page
+    viewport: dict = {"width": 1920, "height": 1080}
+    blocked_resource_types: frozenset = BLOCKED_RESOURCE_TYPES
+    # JPEG keeps photo-heavy deal pages several times smaller than PNG; set "png" for lossless
+    screenshot_format: str = "jpeg"
+    screenshot_quality: int = 80
 
     def __init__(self, base_url: str, scrape_config: Optional[dict] = None):
         self.base_url = base_url
         self.scrape_config = scrape_config or {}
         self._browser: Optional[Browser] = None
         self._context: Optional[BrowserContext] = None
-        self._playwright = None
 
     async def _launch_browser(self) -> BrowserContext:
-        """Launch headless Chromium and return a browser context."""
-        self._playwright = await async_playwright().start()
-        self._browser = await self._playwright.chromium.launch(
-            headless=True,
-            args=["--no-sandbox", "--disable-dev-shm-usage"],
-        )
-        self._context = await self._browser.new_context(
-            user_agent=USER_AGENT,
-            viewport={"width": 1920, "height": 1080},
-            locale="en-CA",
-            timezone_id="America/Toronto",
-        )
-        self._context.set_default_timeout(NAV_TIMEOUT_MS)
+        """Take a pooled headless Chromium and open a fresh browser context on it."""
+        self._browser = await browser_pool.acquire()
+        try:
+            self._context = await self._browser.new_context(
+                user_agent=USER_AGENT,
+                viewport=self.viewport,
+                locale="en-CA",
+                timezone_id="America/Toronto",
+            )
+            self._context.set_default_timeout(NAV_TIMEOUT_MS)
+            await self._context.route("**/*", self._route_filter)
+        except BaseException:
+            # Give the browser back so the retry takes it afresh, rather than leaking a pool slot
+            # or reusing a context without the request filter
+            await self._close_browser()
+            raise
         return self._context
 
+    async def _route_filter(self, route: Route) -> None:
+        """Abort requests for blocked resource types or tracking hosts; continue everything else."""
+        request = route.request
+        host = urlsplit(request.url).hostname or ""
+        if request.resource_type in self.blocked_resource_types or any(
+            host == domain or host.endswith("." + domain) for domain in BLOCKED_DOMAINS
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
+
     async def _close_browser(self):
-        """Clean up browser resources."""
+        """Close the browser context and hand the browser back to the pool."""
         try:
             if self._context:
                 await self._context.close()
-            if self._browser:
-                await self._browser.close()
-            if self._playwright:
-                await self._playwright.stop()
         except Exception as e:
             logger.warning(f"[{self.retailer_slug}] Browser cleanup error: {e}")
         finally:
+            if self._browser:
+                await browser_pool.release(self._browser)
             self._context = None
             self._browser = None
-            self._playwright = None
 
     async def navigate_to_deals(self, page: Page) -> None:
         """
@@ -102,115 +167,154 @@ class BaseScraper:
 
     async def dismiss_popups(self, page: Page) -> None:
         """
-        Dismiss cookie banners, newsletter popups, etc. Override in subclasses.
-        Default implementation attempts common dismiss patterns.
+        Dismiss cookie banners, newsletter popups, etc. listed in popup_selectors.
+
+        Each group holds one popup's dismiss buttons, and groups are handled in order. One query
+        across every group comes first, so a page without popups costs a single round trip.
         """
-        common_selectors = [
-            "button:has-text('Accept')",
-            "button:has-text('Accept All')",
-            "button:has-text('I Accept')",
-            "button:has-text('Got it')",
-            "button:has-text('Close')",
-            "[aria-label='Close']",
-            ".cookie-banner button",
-            "#onetrust-accept-btn-handler",
-        ]
-        for selector in common_selectors:
+        def visible(selectors) -> Locator:
+            return page.locator(", ".join(f"{selector}:visible" for selector in selectors))
+
+        try:
+            if not await visible([s for group in self.popup_selectors for s in group]).count():
+                return
+        except Exception:
+            return
+
+        for group in self.popup_selectors:
             try:
-                btn = page.locator(selector).first
-                if await btn.is_visible(timeout=1000):
-                    await btn.click()
+                buttons = visible(group)
+                if await buttons.count():
+                    await buttons.first.click(timeout=2000)
                     await asyncio.sleep(0.5)
-                    break
             except Exception:
-                continue
+                pass
 
     async def scroll_for_content(self, page: Page) -> None:
         """
         Scroll to trigger lazy loading. Override for sites that need special scrolling.
         Default scrolls down in increments, with a safety cap to prevent infinite loops.
+        The loop runs inside the page so the whole scroll is one round trip to the browser.
         """
-        viewport_height = page.viewport_size["height"]
-        page_height = await page.evaluate("() => document.body.scrollHeight")
-        position = 0
-        iterations = 0
-        while position < page_height and iterations < MAX_SCROLL_ITERATIONS:
-            position += viewport_height * 0.8
-            await page.evaluate(f"window.scrollTo(0, {int(position)})")
-            await asyncio.sleep(0.5)
-            # Check if new content loaded (page got taller)
-            new_height = await page.evaluate("() => document.body.scrollHeight")
-            if new_height > page_height:
-                page_height = new_height
-            iterations += 1
-        if iterations >= MAX_SCROLL_ITERATIONS:
+        scroll = await page.evaluate(SCROLL_JS, {
+            "step": self.viewport["height"] * 0.8,
+            "pauseMs": 500,
+            "maxIterations": MAX_SCROLL_ITERATIONS,
+        })
+        if scroll["iterations"] >= MAX_SCROLL_ITERATIONS:
             logger.warning(f"[{self.retailer_slug}] Scroll capped at {MAX_SCROLL_ITERATIONS} iterations")
 
-    async def capture_screenshot(self, page: Page) -> bytes:
-        """Capture a full-page screenshot as PNG bytes."""
-        return await page.screenshot(full_page=True, type="png")
+    async def capture_screenshot(self, page: Page) -> str:
+        """
+        Write a full-page screenshot in screenshot_format straight to screenshot storage.
+
+        Returns the storage-relative path; the image is never held on the result.
+        """
+        filepath = new_screenshot_path(self.retailer_slug, self.screenshot_format)
+        if self.screenshot_format == "jpeg":
+            await page.screenshot(path=filepath, full_page=True, type="jpeg", quality=self.screenshot_quality)
+        else:
+            await page.screenshot(path=filepath, full_page=True, type="png")
+        logger.info(f"[{self.retailer_slug}] Screenshot saved: {filepath}")
+        return storage_relative_path(filepath)
+
+    async def capture_html(self, page: Page) -> bytes:
+        """
+        Capture the full page HTML content, gzipped.
 
-    async def capture_html(self, page: Page) -> str:
-        """Capture the full page HTML content."""
-        return await page.content()
+        Deal pages run to megabytes of markup; level 1 still shrinks them several times over
+        at a negligible CPU cost, which keeps concurrent results small until they are saved.
+        """
+        return gzip.compress((await page.content()).encode("utf-8"), compresslevel=1)
 
     async def run(self) -> ScrapeResult:
         """
         Execute the full scrape flow with retries and error handling.
 
-        Flow: launch browser → navigate → dismiss popups → scroll → screenshot → save HTML → cleanup
+        Flow: acquire pooled browser → navigate → dismiss popups → scroll → screenshot → save HTML → cleanup
         """
         result = ScrapeResult(started_at=datetime.now(timezone.utc))
         last_error = None
 
-        for attempt in range(MAX_RETRIES):
-            try:
-                if attempt > 0:
-                    wait_time = RETRY_BACKOFF[min(attempt - 1, len(RETRY_BACKOFF) - 1)]
-                    logger.info(f"[{self.retailer_slug}] Retry {attempt}/{MAX_RETRIES} after {wait_time}s")
-                    await asyncio.sleep(wait_time)
-
-                context = await self._launch_browser()
-                page = await context.new_page()
-
-                # Navigate to deals page
-                logger.info(f"[{self.retailer_slug}] Navigating to {self.base_url}")
-                await self.navigate_to_deals(page)
-                await asyncio.sleep(RATE_LIMIT_SECONDS)
-
-                # Handle popups
-                await self.dismiss_popups(page)
-
-                # Scroll to load lazy content
-                await self.scroll_for_content(page)
-                await asyncio.sleep(1)  # Let content settle
-
-                # Capture screenshot
-                screenshot_bytes = await self.capture_screenshot(page)
-
-                # Capture HTML for Phase 3 AI extraction
-                html_content = await self.capture_html(page)
-
-                result.page_title = await page.title()
-                result.page_url = page.url
-                result.status = "completed"
-                result.completed_at = datetime.now(timezone.utc)
-
-                # Store captured data for the manager to save via storage utils
-                result.screenshot_bytes = screenshot_bytes
-                result.html_content = html_content
-
-                logger.info(f"[{self.retailer_slug}] Scrape completed successfully")
-                return result
-
-            except PlaywrightTimeout as e:
-                last_error = f"Timeout: {e}"
-                logger.warning(f"[{self.retailer_slug}] Attempt {attempt + 1} timed out: {e}")
-            except Exception as e:
-                last_error = f"{type(e).__name__}: {e}"
-                logger.warning(f"[{self.retailer_slug}] Attempt {attempt + 1} failed: {e}")
-            finally:
-                await self._close_browser()
+        # One context serves every attempt; a retry only opens a new page on it
+        try:
+            for attempt in range(MAX_RETRIES):
+                page = None
+                try:
+                    if attempt > 0:
+                        wait_time = RETRY_BACKOFF[min(attempt - 1, len(RETRY_BACKOFF) - 1)]
+                        logger.info(f"[{self.retailer_slug}] Retry {attempt}/{MAX_RETRIES} after {wait_time}s")
+                        await asyncio.sleep(wait_time)
+
+                    if self._context is None:
+                        await self._launch_browser()
+                    elif attempt > 0:
+                        # Start the retry from a clean session rather than whatever the failed attempt set
+                        await self._context.clear_cookies()
+                    page = await self._context.new_page()
+
+                    # Space out hits on the same host (retries, shared sites) without holding up others
+                    await host_limiter.acquire(urlsplit(self.base_url).hostname or "", RATE_LIMIT_SECONDS)
+
+                    # Navigate to deals page
+                    logger.info(f"[{self.retailer_slug}] Navigating to {self.base_url}")
+                    await self.navigate_to_deals(page)
+                    # Let the page finish loading, bounded, rather than always sleeping the full time
+                    try:
+                        await page.wait_for_load_state("load", timeout=SETTLE_TIMEOUT_MS)
+                    except PlaywrightTimeout:
+                        pass
+
+                    # Handle popups
+                    await self.dismiss_popups(page)
+
+                    # Scroll to load lazy content
+                    await self.scroll_for_content(page)
+                    await asyncio.sleep(1)  # Let content settle
+
+                    # HTML (for Phase 3 AI extraction), title and screenshot are independent reads;
+                    # running them together hides the smaller round trips behind the screenshot
+                    captured = await asyncio.gather(
+                        self.capture_html(page), page.title(), self.capture_screenshot(page),
+                        return_exceptions=True,
+                    )
+                    errors = [c for c in captured if isinstance(c, BaseException)]
+                    if errors:
+                        # Don't leave a failed attempt's screenshot on disk
+                        if not isinstance(captured[2], BaseException):
+                            delete_stored_file(captured[2])
+                        raise errors[0]
+                    html_gzip, page_title, screenshot_path = captured
+
+                    result.page_title = page_title
+                    result.page_url = page.url
+                    result.status = "completed"
+                    result.completed_at = datetime.now(timezone.utc)
+
+                    # The manager saves the HTML via storage utils and records the screenshot path
+                    result.screenshot_paths.append(screenshot_path)
+                    result.html_gzip = html_gzip
+
+                    logger.info(f"[{self.retailer_slug}] Scrape completed successfully")
+                    return result
+
+                except PlaywrightTimeout as e:
+                    last_error = f"Timeout: {e}"
+                    logger.warning(f"[{self.retailer_slug}] Attempt {attempt + 1} timed out: {e}")
+                except Exception as e:
+                    last_error = f"{type(e).__name__}: {e}"
+                    logger.warning(f"[{self.retailer_slug}] Attempt {attempt + 1} failed: {e}")
+                    # A crashed browser can't serve the next attempt; drop it so a fresh one is taken
+                    if self._browser is not None and not self._browser.is_connected():
+                        await self._close_browser()
+                finally:
+                    if page is not None:
+                        try:
+                            await page.close()
+                        except Exception:
+                            pass
+        finally:
+            await self._close_browser()
 
         # All retries exhausted
         result.status = "failed"
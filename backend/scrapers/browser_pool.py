@@ -0,0 +1,93 @@
+"""Shared pool of headless Chromium browsers so scrapes reuse launched processes."""
+
+import asyncio
+import logging
+
+from playwright.async_api import async_playwright, Browser
+
+logger = logging.getLogger(__name__)
+
+BROWSER_LAUNCH_ARGS = ["--no-sandbox", "--disable-dev-shm-usage"]
+# One browser per concurrent scrape (see scrapers.manager.MAX_CONCURRENT_SCRAPES)
+POOL_SIZE = 3
+# Relaunch a browser after this many scrapes to bound renderer memory growth
+MAX_BROWSER_USES = 20
+
+
+class BrowserPool:
+    """
+    Up to ``size`` Chromium browsers driven by a single, process-wide Playwright driver.
+
+    acquire() hands out an idle browser, launching a new one while the pool is below size and
+    waiting for a release otherwise. Callers open their own BrowserContext on it, so cookies and
+    storage stay isolated per scrape while the process launch is paid once per browser.
+    """
+
+    def __init__(self, size: int = POOL_SIZE, max_uses: int = MAX_BROWSER_USES):
+        self.size = size
+        self.max_uses = max_uses
+        self._playwright = None
+        self._idle: list[Browser] = []
+        self._uses: dict[Browser, int] = {}
+        self._slots = asyncio.Semaphore(size)
+
+    async def _launch(self) -> Browser:
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        browser = await self._playwright.chromium.launch(headless=True, args=BROWSER_LAUNCH_ARGS)
+        self._uses[browser] = 0
+        return browser
+
+    async def _retire(self, browser: Browser) -> None:
+        self._uses.pop(browser, None)
+        try:
+            await browser.close()
+        except Exception as e:
+            logger.warning(f"Browser close error: {e}")
+
+    async def acquire(self) -> Browser:
+        """Take a connected browser from the pool, waiting if all of them are in use."""
+        await self._slots.acquire()
+        try:
+            while self._idle:
+                browser = self._idle.pop()
+                if browser.is_connected():
+                    break
+                await self._retire(browser)
+            else:
+                browser = await self._launch()
+            self._uses[browser] += 1
+            return browser
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def release(self, browser: Browser) -> None:
+        """Return a browser after its contexts are closed; worn-out or crashed ones are closed."""
+        try:
+            if browser.is_connected() and self._uses.get(browser, self.max_uses) < self.max_uses:
+                self._idle.append(browser)
+            else:
+                await self._retire(browser)
+        finally:
+            self._slots.release()
+
+    async def close_browsers(self) -> None:
+        """Close every browser once no scrape holds one; the Playwright driver stays up for reuse."""
+        for browser in list(self._uses):
+            await self._retire(browser)
+        self._idle.clear()
+        self._slots = asyncio.Semaphore(self.size)
+
+    async def shutdown(self) -> None:
+        """Close every browser and stop the Playwright driver (app shutdown)."""
+        await self.close_browsers()
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception as e:
+                logger.warning(f"Playwright shutdown error: {e}")
+            self._playwright = None
+
+
+browser_pool = BrowserPool()
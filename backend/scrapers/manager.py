@@ -5,15 +5,20 @@ import logging
 from datetime import datetime, timezone
 from typing import Optional
 
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from database.models import ScrapeRun, Retailer
 from scrapers.base import ScrapeResult
+from scrapers.browser_pool import browser_pool
 from scrapers.retailers import SCRAPER_REGISTRY
-from scrapers.utils.storage import save_screenshot, save_html, save_metadata
+from scrapers.utils.storage import save_html, save_metadata
 
 logger = logging.getLogger(__name__)
 
+# Each scrape drives its own headless browser; cap how many run at once
+MAX_CONCURRENT_SCRAPES = 3
+
 # Track whether a scrape is currently running (simple lock for single-process app)
 _current_scrape: Optional[dict] = None
 
@@ -88,54 +93,60 @@ async def run_scrape(retailer_slug: str, trigger_type: str, db: Session) -> list
             logger.warning("No enabled retailers to scrape")
             return []
 
-        run_ids = []
         _current_scrape["retailers_total"] = len(retailers)
 
-        for idx, retailer in enumerate(retailers):
-            _current_scrape["current_retailer"] = retailer.name
-            _current_scrape["progress"] = idx / len(retailers)
-
-            run_id = await _scrape_single_retailer(retailer, trigger_type, db)
-            run_ids.append(run_id)
-
-            _current_scrape["retailers_completed"] = idx + 1
-            _current_scrape["progress"] = (idx + 1) / len(retailers)
-
-            # Rate limit between retailers
-            if idx < len(retailers) - 1:
-                logger.info(f"Waiting 5s before next retailer...")
-                await asyncio.sleep(5)
+        # Create every run record in one batched INSERT and commit, rather than one per retailer
+        scrape_runs = [
+            ScrapeRun(retailer=retailer.name, status="running", trigger_type=trigger_type)
+            for retailer in retailers
+        ]
+        db.add_all(scrape_runs)
+        db.flush()
+        run_ids = [scrape_run.id for scrape_run in scrape_runs]
+        db.commit()
 
-        return run_ids
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SCRAPES)
+
+        async def scrape(retailer: Retailer, run_id: int) -> int:
+            async with semaphore:
+                _current_scrape["current_retailer"] = retailer.name
+                await _scrape_single_retailer(retailer, run_id, db)
+            _current_scrape["retailers_completed"] += 1
+            _current_scrape["progress"] = _current_scrape["retailers_completed"] / len(retailers)
+            return run_id
+
+        # Each retailer is a different site, so their page loads overlap instead of queueing
+        # behind one another. DB work between awaits is synchronous, so sharing db is safe.
+        # Every task is awaited to the end, even when one fails, before the finally below
+        # closes the browsers and releases the lock.
+        outcomes = await asyncio.gather(*map(scrape, retailers, run_ids), return_exceptions=True)
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+        return outcomes
 
     finally:
+        # Browsers are reused across the retailers and retries of one run, then freed until the next;
+        # the Playwright driver itself lives until app shutdown
+        await browser_pool.close_browsers()
         _current_scrape = None
 
 
-async def _scrape_single_retailer(retailer: Retailer, trigger_type: str, db: Session) -> int:
+async def _scrape_single_retailer(retailer: Retailer, run_id: int, db: Session) -> int:
     """
-    Scrape a single retailer: create ScrapeRun, execute scraper, update record.
+    Scrape a single retailer: execute scraper, update its pre-created ScrapeRun record.
     Returns the ScrapeRun ID.
     """
-    # Create the ScrapeRun record
-    scrape_run = ScrapeRun(
-        retailer=retailer.name,
-        status="running",
-        trigger_type=trigger_type,
-    )
-    db.add(scrape_run)
-    db.commit()
-    db.refresh(scrape_run)
-    run_id = scrape_run.id
-
     logger.info(f"[{retailer.slug}] Starting scrape run #{run_id}")
 
     # Get the scraper class
     scraper_class = SCRAPER_REGISTRY.get(retailer.slug)
     if scraper_class is None:
-        scrape_run.status = "failed"
-        scrape_run.error_message = f"No scraper registered for {retailer.slug}"
-        scrape_run.completed_at = datetime.now(timezone.utc)
+        db.execute(update(ScrapeRun).where(ScrapeRun.id == run_id).values(
+            status="failed",
+            error_message=f"No scraper registered for {retailer.slug}",
+            completed_at=datetime.now(timezone.utc),
+        ))
         db.commit()
         logger.error(f"[{retailer.slug}] No scraper registered")
         return run_id
@@ -148,34 +159,31 @@ async def _scrape_single_retailer(retailer: Retailer, trigger_type: str, db: Ses
 
     try:
         result: ScrapeResult = await scraper.run()
+        finished_at = datetime.now(timezone.utc)
     except Exception as e:
+        finished_at = datetime.now(timezone.utc)
         result = ScrapeResult(
             status="failed",
             error_message=f"Unexpected error: {type(e).__name__}: {e}",
-            started_at=datetime.now(timezone.utc),
-            completed_at=datetime.now(timezone.utc),
+            started_at=finished_at,
+            completed_at=finished_at,
         )
         logger.error(f"[{retailer.slug}] Scraper raised exception: {e}")
 
-    # Save files if scrape captured data
-    screenshot_path = None
+    # The scraper writes its screenshot directly; save the HTML if it captured any.
+    # File writes run in a worker thread so other retailers' scrapes keep progressing.
+    screenshot_path = result.screenshot_paths[0] if result.screenshot_paths else None
     html_path = None
 
-    if result.screenshot_bytes:
-        try:
-            screenshot_path = save_screenshot(retailer.slug, result.screenshot_bytes)
-        except Exception as e:
-            logger.error(f"[{retailer.slug}] Failed to save screenshot: {e}")
-
-    if result.html_content:
+    if result.html_gzip:
         try:
-            html_path = save_html(retailer.slug, result.html_content)
+            html_path = await asyncio.to_thread(save_html, retailer.slug, result.html_gzip)
         except Exception as e:
             logger.error(f"[{retailer.slug}] Failed to save HTML: {e}")
 
     # Save metadata
     try:
-        save_metadata(retailer.slug, {
+        await asyncio.to_thread(save_metadata, retailer.slug, {
             "scrape_run_id": run_id,
             "retailer": retailer.name,
             "slug": retailer.slug,
@@ -188,23 +196,24 @@ async def _scrape_single_retailer(retailer: Retailer, trigger_type: str, db: Ses
     except Exception as e:
         logger.warning(f"[{retailer.slug}] Failed to save metadata: {e}")
 
-    # Update the ScrapeRun record
-    scrape_run = db.get(ScrapeRun, run_id)
-    if scrape_run is None:
+    # Update the ScrapeRun record by id; no need to load it back first
+    updated = db.execute(update(ScrapeRun).where(ScrapeRun.id == run_id).values(
+        status=result.status,
+        completed_at=result.completed_at or finished_at,
+        screenshot_path=screenshot_path,
+        html_path=html_path,
+        items_found=result.items_found,
+        error_message=result.error_message,
+    ))
+    if updated.rowcount == 0:
+        db.rollback()
         logger.error(f"[{retailer.slug}] ScrapeRun #{run_id} unexpectedly missing from database")
         return run_id
-    scrape_run.status = result.status
-    scrape_run.completed_at = result.completed_at or datetime.now(timezone.utc)
-    scrape_run.screenshot_path = screenshot_path
-    scrape_run.html_path = html_path
-    scrape_run.items_found = result.items_found
-    scrape_run.error_message = result.error_message
-    db.commit()
 
-    # Update retailer's last_scraped timestamp
+    # Update retailer's last_scraped timestamp in the same commit
     if result.status in ("completed", "partial"):
-        retailer.last_scraped = datetime.now(timezone.utc)
-        db.commit()
+        retailer.last_scraped = finished_at
+    db.commit()
 
     logger.info(f"[{retailer.slug}] Scrape run #{run_id} finished with status: {result.status}")
     return run_id
@@ -0,0 +1,26 @@
+"""Per-host request spacing shared by all scrapers in the process."""
+
+import asyncio
+import time
+
+
+class HostRateLimiter:
+    """
+    Keeps requests to the same host at least min_interval seconds apart.
+
+    Each acquire() reserves the host's next free slot and sleeps until it, so concurrent
+    callers for one host queue up in order while different hosts never wait on each other.
+    """
+
+    def __init__(self):
+        self._next_slot: dict[str, float] = {}
+
+    async def acquire(self, host: str, min_interval: float) -> None:
+        now = time.monotonic()
+        slot = max(now, self._next_slot.get(host, now))
+        self._next_slot[host] = slot + min_interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+host_limiter = HostRateLimiter()
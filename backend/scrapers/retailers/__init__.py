@@ -1,5 +1,10 @@
 """Retailer-specific scraper implementations."""
 
+import logging
+
+from sqlalchemy.orm import Session
+
+from database.models import Retailer
 from scrapers.retailers.bestbuy import BestBuyScraper
 from scrapers.retailers.staples import StaplesScraper
 from scrapers.retailers.walmart import WalmartScraper
@@ -20,8 +25,20 @@ SCRAPER_REGISTRY = {
     "thesource": TheSourceScraper,
 }
 
+logger = logging.getLogger(__name__)
+
+
+def validate_registry(db: Session) -> set[str]:
+    """Return (and log) the slugs of scrape-enabled retailers that have no registered scraper."""
+    enabled = db.query(Retailer.slug).filter(Retailer.scrape_enabled.is_(True))
+    missing = {slug for (slug,) in enabled} - SCRAPER_REGISTRY.keys()
+    if missing:
+        logger.warning(f"Scrape-enabled retailers without a scraper: {', '.join(sorted(missing))}")
+    return missing
+
 __all__ = [
     "SCRAPER_REGISTRY",
+    "validate_registry",
     "BestBuyScraper",
     "StaplesScraper",
     "WalmartScraper",
@@ -4,7 +4,7 @@ import logging
 
 from playwright.async_api import Page
 
-from scrapers.base import BaseScraper
+from scrapers.base import LISTING_TIMEOUT_MS, PAGE_LOAD_TIMEOUT_MS, BaseScraper
 
 logger = logging.getLogger(__name__)
 
@@ -15,12 +15,10 @@ class MemoryExpressScraper(BaseScraper):
 
     async def navigate_to_deals(self, page: Page) -> None:
         """Navigate to Memory Express laptop category."""
-        await page.goto(self.base_url, wait_until="domcontentloaded", timeout=60_000)
+        await page.goto(self.base_url, wait_until="domcontentloaded", timeout=PAGE_LOAD_TIMEOUT_MS)
         try:
-            await page.wait_for_selector(".c-shca-icon-item, .PIV_CompareLine, .PROD_header", timeout=15_000)
+            await page.wait_for_selector(".c-shca-icon-item, .PIV_CompareLine, .PROD_header", timeout=LISTING_TIMEOUT_MS)
         except Exception:
             logger.info(f"[{self.retailer_slug}] Product listing not found, continuing with page as-is")
 
-    async def dismiss_popups(self, page: Page) -> None:
-        """Handle Memory Express popups."""
-        await super().dismiss_popups(page)
+    # dismiss_popups: uses BaseScraper default (common cookie banner/modal selectors)
@@ -1,11 +1,10 @@
 """The Source scraper — thesource.ca laptop deals."""
 
-import asyncio
 import logging
 
 from playwright.async_api import Page
 
-from scrapers.base import BaseScraper
+from scrapers.base import LISTING_TIMEOUT_MS, PAGE_LOAD_TIMEOUT_MS, BaseScraper
 
 logger = logging.getLogger(__name__)
 
@@ -13,23 +12,14 @@ logger = logging.getLogger(__name__)
 class TheSourceScraper(BaseScraper):
     retailer_slug = "thesource"
     retailer_name = "The Source"
+    popup_selectors = BaseScraper.popup_selectors + (
+        ("[class*='popup'] .close", "button:has-text('No Thanks')"),  # Age gate / newsletter popup
+    )
 
     async def navigate_to_deals(self, page: Page) -> None:
         """Navigate to The Source laptop category page."""
-        await page.goto(self.base_url, wait_until="domcontentloaded", timeout=60_000)
+        await page.goto(self.base_url, wait_until="domcontentloaded", timeout=PAGE_LOAD_TIMEOUT_MS)
         try:
-            await page.wait_for_selector(".product-listing, .plp-card, .product-tile", timeout=15_000)
+            await page.wait_for_selector(".product-listing, .plp-card, .product-tile", timeout=LISTING_TIMEOUT_MS)
         except Exception:
             logger.info(f"[{self.retailer_slug}] Product listing not found, continuing with page as-is")
-
-    async def dismiss_popups(self, page: Page) -> None:
-        """Handle The Source popups and cookie consent."""
-        await super().dismiss_popups(page)
-        # The Source sometimes has age gate or newsletter popup
-        try:
-            close = page.locator("[class*='popup'] .close, button:has-text('No Thanks')")
-            if await close.first.is_visible(timeout=2000):
-                await close.first.click()
-                await asyncio.sleep(0.5)
-        except Exception:
-            pass
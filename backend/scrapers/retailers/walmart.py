@@ -1,11 +1,10 @@
 """Walmart Canada scraper — walmart.ca laptop rollbacks and deals."""
 
-import asyncio
 import logging
 
 from playwright.async_api import Page
 
-from scrapers.base import BaseScraper
+from scrapers.base import LISTING_TIMEOUT_MS, PAGE_LOAD_TIMEOUT_MS, BaseScraper
 
 logger = logging.getLogger(__name__)
 
@@ -13,34 +12,19 @@ logger = logging.getLogger(__name__)
 class WalmartScraper(BaseScraper):
     retailer_slug = "walmart"
     retailer_name = "Walmart"
+    popup_selectors = (
+        ("button:has-text('Accept')", "button:has-text('Accept All Cookies')"),  # Cookie consent
+        ("[data-testid='flyout-close']", "button[aria-label='close']"),  # Location picker
+    )
 
     async def navigate_to_deals(self, page: Page) -> None:
         """Navigate to Walmart's laptop category page."""
-        await page.goto(self.base_url, wait_until="domcontentloaded", timeout=60_000)
+        await page.goto(self.base_url, wait_until="domcontentloaded", timeout=PAGE_LOAD_TIMEOUT_MS)
         try:
-            await page.wait_for_selector("[data-testid='product-tile'], .product-tile, .search-result-listview-items", timeout=15_000)
+            await page.wait_for_selector("[data-testid='product-tile'], .product-tile, .search-result-listview-items", timeout=LISTING_TIMEOUT_MS)
         except Exception:
             logger.info(f"[{self.retailer_slug}] Product tiles not found, continuing with page as-is")
 
-    async def dismiss_popups(self, page: Page) -> None:
-        """Handle Walmart cookie consent and location prompts."""
-        try:
-            consent = page.locator("button:has-text('Accept'), button:has-text('Accept All Cookies')")
-            if await consent.first.is_visible(timeout=3000):
-                await consent.first.click()
-                await asyncio.sleep(1)
-        except Exception:
-            pass
-
-        # Location picker
-        try:
-            close = page.locator("[data-testid='flyout-close'], button[aria-label='close']")
-            if await close.first.is_visible(timeout=2000):
-                await close.first.click()
-                await asyncio.sleep(0.5)
-        except Exception:
-            pass
-
     async def scroll_for_content(self, page: Page) -> None:
         """Scroll through Walmart product listings."""
         await super().scroll_for_content(page)
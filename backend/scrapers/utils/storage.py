@@ -1,16 +1,23 @@
 """Screenshot and HTML storage utilities for the scraping engine."""
 
-import json
+import heapq
 import logging
+import os
 import uuid
 from datetime import datetime, timezone, date
 from pathlib import Path
 from typing import Optional
 
+import orjson
+
 from config import SCREENSHOTS_DIR
 
 logger = logging.getLogger(__name__)
 
+# Screenshot image format -> file suffix, and suffix -> media type for serving
+SCREENSHOT_SUFFIXES = {"png": ".png", "jpeg": ".jpg"}
+SCREENSHOT_MEDIA_TYPES = {".png": "image/png", ".jpg": "image/jpeg"}
+
 
 def _ensure_dir(path: Path) -> Path:
     """Create directory if it doesn't exist and return it."""
@@ -25,35 +32,51 @@ def get_retailer_date_dir(retailer_slug: str, scrape_date: Optional[date] = None
     return _ensure_dir(SCREENSHOTS_DIR / retailer_slug / scrape_date.isoformat())
 
 
-def save_screenshot(retailer_slug: str, png_bytes: bytes, scrape_date: Optional[date] = None) -> str:
-    """
-    Save a PNG screenshot to the organized directory structure.
-
-    Returns the relative path from SCREENSHOTS_DIR (for database storage).
-    """
+def new_screenshot_path(retailer_slug: str, image_format: str = "png", scrape_date: Optional[date] = None) -> Path:
+    """Absolute path for a new screenshot file, so a capture can be written straight to disk."""
     target_dir = get_retailer_date_dir(retailer_slug, scrape_date)
     timestamp = datetime.now(timezone.utc).strftime("%H%M%S")
     short_id = uuid.uuid4().hex[:6]
-    filename = f"{timestamp}_{short_id}_screenshot.png"
-    filepath = target_dir / filename
-    filepath.write_bytes(png_bytes)
-    logger.info(f"Screenshot saved: {filepath} ({len(png_bytes)} bytes)")
+    return target_dir / f"{timestamp}_{short_id}_screenshot{SCREENSHOT_SUFFIXES[image_format]}"
+
+
+def storage_relative_path(filepath: Path) -> str:
+    """Path relative to SCREENSHOTS_DIR, as stored in the database."""
     return str(filepath.relative_to(SCREENSHOTS_DIR))
 
 
-def save_html(retailer_slug: str, html_content: str, scrape_date: Optional[date] = None) -> str:
+def delete_stored_file(relative_path: str) -> None:
+    """Remove a file written under SCREENSHOTS_DIR, e.g. a capture from a failed attempt."""
+    (SCREENSHOTS_DIR / relative_path).unlink(missing_ok=True)
+
+
+def save_screenshot(
+    retailer_slug: str, image_bytes: bytes, scrape_date: Optional[date] = None, image_format: str = "png",
+) -> str:
+    """
+    Save a PNG or JPEG screenshot to the organized directory structure.
+
+    Returns the relative path from SCREENSHOTS_DIR (for database storage).
+    """
+    filepath = new_screenshot_path(retailer_slug, image_format, scrape_date)
+    filepath.write_bytes(image_bytes)
+    logger.info(f"Screenshot saved: {filepath} ({len(image_bytes)} bytes)")
+    return storage_relative_path(filepath)
+
+
+def save_html(retailer_slug: str, html_gzip: bytes, scrape_date: Optional[date] = None) -> str:
     """
-    Save HTML page content alongside screenshots.
+    Save gzipped HTML page content alongside screenshots, as-is (.html.gz).
 
     Returns the relative path from SCREENSHOTS_DIR.
     """
     target_dir = get_retailer_date_dir(retailer_slug, scrape_date)
     timestamp = datetime.now(timezone.utc).strftime("%H%M%S")
     short_id = uuid.uuid4().hex[:6]
-    filename = f"{timestamp}_{short_id}_page.html"
+    filename = f"{timestamp}_{short_id}_page.html.gz"
     filepath = target_dir / filename
-    filepath.write_text(html_content, encoding="utf-8")
-    logger.info(f"HTML saved: {filepath} ({len(html_content)} chars)")
+    filepath.write_bytes(html_gzip)
+    logger.info(f"HTML saved: {filepath} ({len(html_gzip)} bytes)")
     return str(filepath.relative_to(SCREENSHOTS_DIR))
 
 
@@ -64,17 +87,21 @@ def save_metadata(retailer_slug: str, metadata: dict, scrape_date: Optional[date
     short_id = uuid.uuid4().hex[:6]
     filename = f"{timestamp}_{short_id}_metadata.json"
     filepath = target_dir / filename
-    filepath.write_text(json.dumps(metadata, indent=2, default=str), encoding="utf-8")
+    # orjson writes datetimes as ISO 8601 itself; default=str still covers anything else
+    filepath.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2, default=str))
     return str(filepath.relative_to(SCREENSHOTS_DIR))
 
 
-def list_screenshots(retailer_slug: Optional[str] = None, scrape_date: Optional[str] = None) -> list[dict]:
+def list_screenshots(
+    retailer_slug: Optional[str] = None, scrape_date: Optional[str] = None, limit: Optional[int] = None,
+) -> list[dict]:
     """
-    List available screenshots with metadata.
+    List available screenshots with metadata, by retailer then newest date and file first.
 
     Args:
         retailer_slug: Filter by retailer (None = all retailers)
         scrape_date: Filter by date string "YYYY-MM-DD" (None = all dates)
+        limit: Stop after this many screenshots (None = all); later directories aren't read
 
     Returns:
         List of dicts with: retailer, date, filename, path, size_bytes
@@ -91,42 +118,58 @@ def list_screenshots(retailer_slug: Optional[str] = None, scrape_date: Optional[
             logger.warning(f"Path traversal attempt in list_screenshots date: {scrape_date}")
             return []
 
-    if not SCREENSHOTS_DIR.exists():
-        return []
-
+    # os.scandir reports entry types from the directory listing itself, so telling folders and
+    # images apart needs no stat call; only listed images are stat'ed, once each for their size
     if retailer_slug:
-        retailer_dirs = [SCREENSHOTS_DIR / retailer_slug]
+        slugs = [retailer_slug]
     else:
-        retailer_dirs = [d for d in SCREENSHOTS_DIR.iterdir() if d.is_dir()]
-
-    for retailer_dir in retailer_dirs:
-        if not retailer_dir.exists():
-            continue
-        slug = retailer_dir.name
-
-        if scrape_date:
-            date_dirs = [retailer_dir / scrape_date]
-        else:
-            date_dirs = sorted(
-                [d for d in retailer_dir.iterdir() if d.is_dir()],
-                reverse=True,
-            )
-
-        for date_dir in date_dirs:
-            if not date_dir.exists():
+        slugs = sorted(_subdir_names(SCREENSHOTS_DIR))
+
+    for slug in slugs:
+        retailer_dir = SCREENSHOTS_DIR / slug
+        date_names = [scrape_date] if scrape_date else sorted(_subdir_names(retailer_dir), reverse=True)
+
+        for date_name in date_names:
+            try:
+                with os.scandir(retailer_dir / date_name) as entries:
+                    images = [
+                        e for e in entries
+                        if os.path.splitext(e.name)[1] in SCREENSHOT_MEDIA_TYPES and e.is_file()
+                    ]
+            except (FileNotFoundError, NotADirectoryError):
                 continue
-            for png_file in sorted(date_dir.glob("*.png"), reverse=True):
+            if limit is None:
+                images.sort(key=_entry_name, reverse=True)
+            else:
+                # Only the newest files that still fit are needed, not a full sort
+                images = heapq.nlargest(limit - len(results), images, key=_entry_name)
+            for entry in images:
                 results.append({
                     "retailer": slug,
-                    "date": date_dir.name,
-                    "filename": png_file.name,
-                    "path": f"{slug}/{date_dir.name}/{png_file.name}",
-                    "size_bytes": png_file.stat().st_size,
+                    "date": date_name,
+                    "filename": entry.name,
+                    "path": f"{slug}/{date_name}/{entry.name}",
+                    "size_bytes": entry.stat().st_size,
                 })
+            if limit is not None and len(results) >= limit:
+                return results
 
     return results
 
 
+def _subdir_names(path: Path) -> list[str]:
+    """Names of the directories directly inside path (none if path doesn't exist)."""
+    try:
+        with os.scandir(path) as entries:
+            return [e.name for e in entries if e.is_dir()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def _entry_name(entry: os.DirEntry) -> str:
+    return entry.name
+
+
 def get_screenshot_filepath(retailer: str, date_str: str, filename: str) -> Optional[Path]:
     """
     Resolve a screenshot path. Returns None if the file doesn't exist.
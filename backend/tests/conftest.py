@@ -4,6 +4,7 @@ import os
 import shutil
 import sys
 import tempfile
+from datetime import date
 from pathlib import Path
 
 import pytest
@@ -72,6 +73,14 @@ def reset_scrape_lock():
     release_scrape_lock()
 
 
+@pytest.fixture(autouse=True)
+def reset_response_cache():
+    """Clear cached endpoint responses so each test sees the data it seeded."""
+    yield
+    from api.cache import clear_cache
+    clear_cache()
+
+
 @pytest.fixture
 def client(setup_test_db):
     """FastAPI TestClient with test database."""
@@ -104,3 +113,27 @@ def db_session(setup_test_db):
 def screenshots_dir(setup_test_db):
     """Path to the test screenshots directory."""
     return setup_test_db["screenshots_dir"]
+
+
+@pytest.fixture
+def promotions(db_session):
+    """Seed a small set of promotions; the pending one must never be counted."""
+    from database.models import Promotion
+    rows = [
+        Promotion(retailer="Best Buy", vendor="HP", sku="HP-1", msrp=1000, ad_price=800, discount=200,
+                  discount_pct=20.0, cycle="BTS'25", week_date=date(2025, 7, 4), review_status="approved"),
+        Promotion(retailer="Best Buy", vendor="Dell", sku="DL-1", msrp=1500, ad_price=1200, discount=300,
+                  discount_pct=20.0, cycle="BTS'25", week_date=date(2025, 7, 11), review_status="approved"),
+        Promotion(retailer="Staples", vendor="HP", sku="HP-2", msrp=500, ad_price=450, discount=50,
+                  discount_pct=10.0, cycle="HOL'25", week_date=date(2025, 11, 28), review_status="approved"),
+        Promotion(retailer="Staples", vendor="Lenovo", sku="LN-1", msrp=2500, ad_price=2100, discount=None,
+                  discount_pct=None, cycle="HOL'25", week_date=date(2025, 12, 5), review_status="approved"),
+        Promotion(retailer="Walmart", vendor="Acer", sku="AC-1", msrp=600, ad_price=300, discount=300,
+                  discount_pct=50.0, cycle="HOL'25", week_date=date(2026, 1, 2), review_status="pending"),
+    ]
+    db_session.add_all(rows)
+    db_session.commit()
+    yield rows
+    for p in rows:
+        db_session.delete(p)
+    db_session.commit()
@@ -0,0 +1,150 @@
+"""Integration tests for analytics API endpoints."""
+
+import os
+import sys
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+
+class TestSummary:
+    def test_summary_aggregates(self, client, promotions):
+        """GET /api/analytics/summary aggregates approved promotions only."""
+        res = client.get("/api/analytics/summary")
+        assert res.status_code == 200
+        data = res.json()
+        assert data["total_promotions"] == 4
+        assert data["total_retailers"] == 2
+        assert data["total_vendors"] == 3
+        assert data["total_cycles"] == 2
+        assert data["avg_discount_pct"] == 16.7
+        assert data["date_range"] == {"earliest": "2025-07-04", "latest": "2025-12-05"}
+
+    def test_summary_empty(self, client):
+        """GET /api/analytics/summary returns zeros when there is no data."""
+        res = client.get("/api/analytics/summary")
+        assert res.status_code == 200
+        data = res.json()
+        assert data["total_promotions"] == 0
+        assert data["avg_discount_pct"] == 0
+        assert data["date_range"] == {"earliest": None, "latest": None}
+
+
+class TestPriceDistribution:
+    def test_bands(self, client, promotions):
+        """GET /api/analytics/price-distribution buckets approved ad prices by band."""
+        res = client.get("/api/analytics/price-distribution")
+        assert res.status_code == 200
+        assert res.json() == [
+            {"band": "$0-500", "count": 1},
+            {"band": "$500-1000", "count": 1},
+            {"band": "$1000-1500", "count": 1},
+            {"band": "$1500-2000", "count": 0},
+            {"band": "$2000+", "count": 1},
+        ]
+
+    def test_bands_filtered(self, client, promotions):
+        """Filters apply to every band."""
+        res = client.get("/api/analytics/price-distribution", params={"retailer": "Staples"})
+        counts = {b["band"]: b["count"] for b in res.json()}
+        assert counts == {"$0-500": 1, "$500-1000": 0, "$1000-1500": 0, "$1500-2000": 0, "$2000+": 1}
+
+    def test_bands_empty(self, client):
+        """Bands report zero rather than null when no rows match."""
+        res = client.get("/api/analytics/price-distribution")
+        assert all(b["count"] == 0 for b in res.json())
+
+
+class TestResponseCache:
+    def test_cached_until_cleared(self, client, promotions, db_session):
+        """Analytics responses are served from cache until the namespace is cleared."""
+        from api.cache import clear_cache
+        from database.models import Promotion
+        first = client.get("/api/analytics/summary").json()
+
+        extra = Promotion(retailer="Costco", vendor="Apple", sku="MB-1", ad_price=1999, review_status="approved")
+        db_session.add(extra)
+        db_session.commit()
+        try:
+            assert client.get("/api/analytics/summary").json() == first
+            clear_cache("analytics")
+            assert client.get("/api/analytics/summary").json()["total_promotions"] == first["total_promotions"] + 1
+        finally:
+            db_session.delete(extra)
+            db_session.commit()
+
+    def test_keyed_by_query_params(self, client, promotions):
+        """Different filters get separate cache entries."""
+        all_rows = client.get("/api/analytics/by-retailer").json()
+        bts = client.get("/api/analytics/by-retailer", params={"cycle": "BTS'25"}).json()
+        assert {r["retailer"] for r in all_rows} == {"Best Buy", "Staples"}
+        assert {r["retailer"] for r in bts} == {"Best Buy"}
+
+
+class TestGroupedAnalytics:
+    def test_by_retailer(self, client, promotions):
+        """GET /api/analytics/by-retailer aggregates approved promotions per retailer."""
+        rows = {r["retailer"]: r for r in client.get("/api/analytics/by-retailer").json()}
+        assert set(rows) == {"Best Buy", "Staples"}
+        assert rows["Best Buy"] == {
+            "retailer": "Best Buy", "count": 2, "avg_price": 1000.0, "avg_discount_pct": 20.0,
+            "min_price": 800.0, "max_price": 1200.0,
+        }
+        assert rows["Staples"]["avg_discount_pct"] == 10.0
+        assert rows["Staples"]["avg_price"] == 1275.0
+
+    def test_by_vendor_filtered(self, client, promotions):
+        """GET /api/analytics/by-vendor honours retailer and cycle filters."""
+        rows = client.get("/api/analytics/by-vendor", params={"retailer": "Staples", "cycle": "HOL'25"}).json()
+        assert {r["vendor"]: r["count"] for r in rows} == {"HP": 1, "Lenovo": 1}
+
+    def test_heatmap(self, client, promotions):
+        """GET /api/analytics/vendor-retailer-heatmap counts per vendor/retailer pair."""
+        rows = client.get("/api/analytics/vendor-retailer-heatmap").json()
+        counts = {(r["vendor"], r["retailer"]): r["count"] for r in rows}
+        assert counts == {("HP", "Best Buy"): 1, ("Dell", "Best Buy"): 1, ("HP", "Staples"): 1, ("Lenovo", "Staples"): 1}
+
+    def test_discount_trends(self, client, promotions):
+        """GET /api/analytics/discount-trends only counts promotions with a discount_pct."""
+        rows = client.get("/api/analytics/discount-trends").json()
+        assert rows == [
+            {"cycle": "BTS'25", "avg_discount_pct": 20.0, "avg_discount_dollars": 250.0, "avg_price": 1000.0, "count": 2},
+            {"cycle": "HOL'25", "avg_discount_pct": 10.0, "avg_discount_dollars": 50.0, "avg_price": 450.0, "count": 1},
+        ]
+
+    def test_summary_follows_updates(self, client, promotions, db_session):
+        """Approving or editing a promotion is reflected in the grouped endpoints."""
+        from api.cache import clear_cache
+        pending = promotions[-1]
+        pending.review_status = "approved"
+        db_session.commit()
+        clear_cache()
+        rows = {r["retailer"]: r for r in client.get("/api/analytics/by-retailer").json()}
+        assert rows["Walmart"]["count"] == 1
+
+        pending.retailer = "Costco"
+        db_session.commit()
+        clear_cache()
+        rows = {r["retailer"]: r for r in client.get("/api/analytics/by-retailer").json()}
+        assert "Walmart" not in rows
+        assert rows["Costco"]["avg_discount_pct"] == 50.0
+
+    def test_discount_trends_cycle_order(self, client, promotions, db_session):
+        """Cycles are ordered chronologically by year and season from the cycles table."""
+        from database.models import Cycle, Promotion
+        spring = Promotion(retailer="Staples", vendor="HP", sku="HP-3", ad_price=700, discount_pct=5.0,
+                           cycle="SPR'25", review_status="approved")
+        cycles = [
+            Cycle(code="HOL'25", name="Holiday 2025", season="holiday", year=2025),
+            Cycle(code="SPR'25", name="Spring 2025", season="spring", year=2025),
+            Cycle(code="BTS'25", name="Back-to-School 2025", season="bts", year=2025),
+        ]
+        db_session.add_all(cycles + [spring])
+        db_session.commit()
+        try:
+            rows = client.get("/api/analytics/discount-trends").json()
+            assert [r["cycle"] for r in rows] == ["SPR'25", "BTS'25", "HOL'25"]
+        finally:
+            for obj in cycles + [spring]:
+                db_session.delete(obj)
+            db_session.commit()
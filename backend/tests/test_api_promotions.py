@@ -0,0 +1,107 @@
+"""Integration tests for promotion API endpoints."""
+
+import os
+import sys
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+
+class TestListPromotions:
+    def test_list_approved_only(self, client, promotions):
+        """GET /api/promotions returns approved promotions with the filtered total."""
+        res = client.get("/api/promotions")
+        assert res.status_code == 200
+        data = res.json()
+        assert data["total"] == 4
+        assert data["pages"] == 1
+        assert {p["sku"] for p in data["items"]} == {"HP-1", "DL-1", "HP-2", "LN-1"}
+
+    def test_pagination_total(self, client, promotions):
+        """The total reflects every matching row, not just the current page."""
+        res = client.get("/api/promotions", params={"per_page": 3, "page": 2, "sort_by": "ad_price", "sort_dir": "asc"})
+        data = res.json()
+        assert data["total"] == 4
+        assert data["pages"] == 2
+        assert [p["sku"] for p in data["items"]] == ["LN-1"]
+
+    def test_page_past_end(self, client, promotions):
+        """A page beyond the last still reports the real total."""
+        data = client.get("/api/promotions", params={"per_page": 3, "page": 5}).json()
+        assert data["items"] == []
+        assert data["total"] == 4
+
+    def test_filters(self, client, promotions):
+        """Retailer and price filters narrow the result set."""
+        data = client.get("/api/promotions", params={"retailer": "Staples", "max_price": 1000}).json()
+        assert data["total"] == 1
+        assert data["items"][0]["sku"] == "HP-2"
+
+    def test_search(self, client, promotions):
+        """Search matches SKU substrings case-insensitively."""
+        data = client.get("/api/promotions", params={"search": "hp-"}).json()
+        assert {p["sku"] for p in data["items"]} == {"HP-1", "HP-2"}
+
+    def test_search_short_term(self, client, promotions):
+        """Terms shorter than a trigram still match via ILIKE."""
+        data = client.get("/api/promotions", params={"search": "ln"}).json()
+        assert [p["sku"] for p in data["items"]] == ["LN-1"]
+
+    def test_search_follows_edits(self, client, promotions, db_session):
+        """The search index tracks inserts and updates to searchable columns."""
+        promo = promotions[1]
+        promo.cpu = "Ryzen 7 8840U"
+        db_session.commit()
+        data = client.get("/api/promotions", params={"search": "ryzen 7"}).json()
+        assert [p["sku"] for p in data["items"]] == ["DL-1"]
+
+        promo.cpu = None
+        db_session.commit()
+        assert client.get("/api/promotions", params={"search": "ryzen 7"}).json()["total"] == 0
+
+    def test_search_special_characters(self, client, promotions):
+        """FTS query syntax in the search term is treated literally."""
+        res = client.get("/api/promotions", params={"search": 'HP" OR "DL'})
+        assert res.status_code == 200
+        assert res.json()["total"] == 0
+
+    def test_gzip_large_responses(self, client, promotions):
+        """Responses over the size threshold are gzip-compressed when the client accepts it."""
+        res = client.get("/api/promotions", headers={"Accept-Encoding": "gzip"})
+        assert res.headers.get("content-encoding") == "gzip"
+        assert res.json()["total"] == 4
+
+    def test_invalid_sort_column(self, client):
+        """Unknown sort columns are rejected."""
+        res = client.get("/api/promotions", params={"sort_by": "__class__"})
+        assert res.status_code == 400
+
+
+class TestFilterOptions:
+    def test_filter_options(self, client, promotions):
+        """GET /api/promotions/filters lists distinct values from approved promotions."""
+        data = client.get("/api/promotions/filters").json()
+        assert data["retailers"] == ["Best Buy", "Staples"]
+        assert data["vendors"] == ["Dell", "HP", "Lenovo"]
+        assert data["cycles"] == ["BTS'25", "HOL'25"]
+        assert data["form_factors"] == []
+        assert data["lcd_sizes"] == []
+
+
+class TestGetPromotion:
+    def test_get_existing(self, client, promotions):
+        """GET /api/promotions/{id} returns a single promotion."""
+        pid = promotions[0].id
+        res = client.get(f"/api/promotions/{pid}")
+        assert res.status_code == 200
+        assert res.json()["sku"] == "HP-1"
+        assert res.json()["week_date"] == "2025-07-04"
+        assert list(res.json()) == [
+            "id", "retailer", "vendor", "sku", "msrp", "ad_price", "discount", "discount_pct", "cycle",
+            "week_date", "form_factor", "lcd_size", "resolution", "touch", "os", "cpu", "gpu", "ram",
+            "storage", "notes", "promo_type", "review_status",
+        ]
+
+    def test_get_missing(self, client):
+        """GET /api/promotions/99999 returns 404."""
+        assert client.get("/api/promotions/99999").status_code == 404
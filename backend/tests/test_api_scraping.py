@@ -92,6 +92,75 @@ class TestTriggerScrape:
             )
             db_session.commit()
 
+    def test_retailers_scraped_concurrently(self, db_session):
+        """run_scrape overlaps retailer scrapes and returns run IDs in retailer order."""
+        import asyncio
+        from database.models import Retailer, ScrapeRun
+        from scrapers.base import ScrapeResult
+        from scrapers.manager import run_scrape
+
+        active = {"now": 0, "peak": 0}
+
+        class FakeScraper:
+            def __init__(self, base_url, scrape_config):
+                pass
+
+            async def run(self):
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+                await asyncio.sleep(0.05)
+                active["now"] -= 1
+                return ScrapeResult(status="completed", completed_at=datetime.now(timezone.utc))
+
+        enabled = db_session.query(Retailer).filter(Retailer.scrape_enabled.is_(True)).all()
+        slugs = [r.slug for r in enabled]
+        names = [r.name for r in enabled]
+        with patch.dict("scrapers.manager.SCRAPER_REGISTRY", {slug: FakeScraper for slug in slugs}), \
+                patch("scrapers.manager.save_metadata"):
+            run_ids = asyncio.get_event_loop().run_until_complete(run_scrape("all", "manual", db_session))
+
+        try:
+            assert active["peak"] > 1
+            runs = [db_session.get(ScrapeRun, run_id) for run_id in run_ids]
+            assert [run.retailer for run in runs] == names
+            assert [run.status for run in runs] == ["completed"] * len(slugs)
+        finally:
+            db_session.query(ScrapeRun).filter(ScrapeRun.id.in_(run_ids)).delete(synchronize_session=False)
+            db_session.commit()
+
+    def test_failed_retailer_waits_for_siblings(self, db_session):
+        """If one retailer raises, the others still finish before the browsers and lock are released."""
+        import asyncio
+        from database.models import Retailer, ScrapeRun
+        from scrapers.manager import get_scrape_status, run_scrape
+        import scrapers.manager as manager
+
+        finished = []
+        state_when_finished = []
+
+        async def fake_single(retailer, run_id, db):
+            if retailer.slug == "bestbuy":
+                raise RuntimeError("database is locked")
+            await asyncio.sleep(0.05)
+            state_when_finished.append(get_scrape_status()["running"])
+            finished.append(retailer.slug)
+            return run_id
+
+        from sqlalchemy import func
+        enabled = db_session.query(Retailer).filter(Retailer.scrape_enabled.is_(True)).all()
+        last_id = db_session.query(func.max(ScrapeRun.id)).scalar() or 0
+        with patch.object(manager, "_scrape_single_retailer", fake_single):
+            with pytest.raises(RuntimeError, match="database is locked"):
+                asyncio.get_event_loop().run_until_complete(run_scrape("all", "manual", db_session))
+
+        try:
+            assert sorted(finished) == sorted(r.slug for r in enabled if r.slug != "bestbuy")
+            assert all(state_when_finished)
+            assert get_scrape_status()["running"] is False
+        finally:
+            db_session.query(ScrapeRun).filter(ScrapeRun.id > last_id).delete(synchronize_session=False)
+            db_session.commit()
+
 
 # ── GET /api/scrape/status ──
 
@@ -149,6 +218,22 @@ class TestListScrapeRuns:
         assert found[0]["status"] == "completed"
         assert found[0]["items_found"] == 5
 
+    def test_list_same_start_ordered_by_id(self, client, db_session):
+        """Runs with identical started_at are listed newest id first."""
+        from database.models import ScrapeRun
+        tie = datetime(2099, 1, 1, tzinfo=timezone.utc)
+        runs = [ScrapeRun(retailer=name, status="running", trigger_type="manual", started_at=tie)
+                for name in ("Tie A", "Tie B", "Tie C")]
+        db_session.add_all(runs)
+        db_session.commit()
+        try:
+            listed = client.get("/api/scrape/runs", params={"limit": 3}).json()["runs"]
+            assert [r["retailer"] for r in listed] == ["Tie C", "Tie B", "Tie A"]
+        finally:
+            for run in runs:
+                db_session.delete(run)
+            db_session.commit()
+
     def test_list_filter_by_retailer(self, client, db_session):
         """GET /api/scrape/runs?retailer=Best Buy filters correctly."""
         from database.models import ScrapeRun
@@ -266,6 +351,26 @@ class TestServeScreenshot:
         assert res.headers["content-type"] == "image/png"
         assert len(res.content) == len(png_data)
 
+    def test_serve_jpeg(self, client, screenshots_dir):
+        """JPEG screenshots are served as image/jpeg."""
+        retailer_dir = screenshots_dir / "bestbuy" / "2026-02-12"
+        retailer_dir.mkdir(parents=True, exist_ok=True)
+        (retailer_dir / "test.jpg").write_bytes(b"\xff\xd8\xff" + b"\x00" * 50)
+
+        res = client.get("/api/screenshots/bestbuy/2026-02-12/test.jpg")
+        assert res.status_code == 200
+        assert res.headers["content-type"] == "image/jpeg"
+
+    def test_serve_uncompressed(self, client, screenshots_dir):
+        """Screenshot files bypass gzip even when the client accepts it."""
+        retailer_dir = screenshots_dir / "bestbuy" / "2026-02-12"
+        retailer_dir.mkdir(parents=True, exist_ok=True)
+        (retailer_dir / "large.png").write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 4096)
+
+        res = client.get("/api/screenshots/bestbuy/2026-02-12/large.png", headers={"Accept-Encoding": "gzip"})
+        assert res.status_code == 200
+        assert "content-encoding" not in res.headers
+
     def test_serve_nonexistent(self, client):
         """GET /api/screenshots/fake/2026-01-01/nope.png returns 404."""
         res = client.get("/api/screenshots/fake/2026-01-01/nope.png")
@@ -286,6 +391,21 @@ class TestServeScreenshot:
         assert res.status_code == 200
         assert "max-age" in res.headers.get("cache-control", "")
 
+    def test_screenshot_not_modified(self, client, screenshots_dir):
+        """A matching If-None-Match gets a 304 with no body."""
+        retailer_dir = screenshots_dir / "bestbuy" / "2026-02-12"
+        retailer_dir.mkdir(parents=True, exist_ok=True)
+        (retailer_dir / "etag.png").write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 10)
+
+        res = client.get("/api/screenshots/bestbuy/2026-02-12/etag.png")
+        etag = res.headers["etag"]
+        res = client.get("/api/screenshots/bestbuy/2026-02-12/etag.png", headers={"If-None-Match": etag})
+        assert res.status_code == 304
+        assert res.content == b""
+
+        res = client.get("/api/screenshots/bestbuy/2026-02-12/etag.png", headers={"If-None-Match": '"stale"'})
+        assert res.status_code == 200
+
 
 # ── GET /api/retailers ──
 
@@ -311,6 +431,45 @@ class TestRetailers:
             assert "scrape_enabled" in r
             assert "last_scraped" in r
 
+    def test_cache_headers(self, client):
+        """Retailer list responses allow short-lived HTTP caching."""
+        res = client.get("/api/retailers")
+        assert "stale-while-revalidate" in res.headers.get("cache-control", "")
+
+    def test_cache_cleared_after_scrape(self, client, db_session):
+        """Completing a background scrape refreshes the cached last_scraped values."""
+        import asyncio
+        from api.scraping import _background_scrape
+        from database.models import Retailer
+        client.get("/api/retailers")
+
+        retailer = db_session.query(Retailer).filter(Retailer.slug == "staples").one()
+        retailer.last_scraped = datetime(2026, 2, 12, tzinfo=timezone.utc)
+        db_session.commit()
+        try:
+            with patch("api.scraping.run_scrape", new_callable=AsyncMock):
+                asyncio.run(_background_scrape("staples", "manual"))
+            staples = [r for r in client.get("/api/retailers").json()["retailers"] if r["slug"] == "staples"]
+            assert staples[0]["last_scraped"].startswith("2026-02-12")
+        finally:
+            retailer.last_scraped = None
+            db_session.commit()
+
+    def test_validate_registry(self, db_session):
+        """Only scrape-enabled retailers without a registered scraper are reported."""
+        from database.models import Retailer
+        from scrapers.retailers import validate_registry
+        assert validate_registry(db_session) == set()
+
+        db_session.add(Retailer(name="Newegg", slug="newegg", base_url="https://www.newegg.ca", scrape_enabled=True))
+        db_session.add(Retailer(name="Dell", slug="dell", base_url="https://www.dell.ca", scrape_enabled=False))
+        db_session.commit()
+        try:
+            assert validate_registry(db_session) == {"newegg"}
+        finally:
+            db_session.query(Retailer).filter(Retailer.slug.in_(["newegg", "dell"])).delete(synchronize_session=False)
+            db_session.commit()
+
     def test_disabled_retailer_visible(self, client):
         """Disabled retailers still appear in the list."""
         res = client.get("/api/retailers")
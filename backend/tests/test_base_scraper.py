@@ -0,0 +1,260 @@
+"""Tests for the BaseScraper run/retry flow, using fake Playwright objects."""
+
+import asyncio
+import gzip
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+
+class FakePage:
+    url = "https://example.test/deals"
+
+    def __init__(self, context):
+        self.context = context
+        self.closed = False
+
+    async def goto(self, url, **kwargs):
+        self.context.gotos += 1
+        if self.context.gotos <= self.context.fail_first:
+            raise RuntimeError("net::ERR_CONNECTION_RESET")
+
+    async def wait_for_load_state(self, state, timeout):
+        pass
+
+    async def evaluate(self, script, *args):
+        return {"iterations": 2, "height": 2000}
+
+    async def screenshot(self, path, **kwargs):
+        path.write_bytes(b"\xff\xd8\xff")
+
+    async def content(self):
+        if self.context.fail_content:
+            raise RuntimeError("Target page, context or browser has been closed")
+        return "<html></html>"
+
+    async def title(self):
+        return "Deals"
+
+    def locator(self, selector):
+        raise RuntimeError("no popups here")
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self, fail_first, fail_content=False):
+        self.fail_first = fail_first
+        self.fail_content = fail_content
+        self.gotos = 0
+        self.pages = []
+        self.cookie_clears = 0
+        self.closed = False
+
+    def set_default_timeout(self, ms):
+        pass
+
+    async def route(self, pattern, handler):
+        self.route_handler = handler
+
+    async def new_page(self):
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+
+    async def clear_cookies(self):
+        self.cookie_clears += 1
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self, fail_first, fail_content=False, fail_new_context=0):
+        self.fail_first = fail_first
+        self.fail_content = fail_content
+        self.fail_new_context = fail_new_context
+        self.contexts = []
+
+    def is_connected(self):
+        return True
+
+    async def new_context(self, **kwargs):
+        if self.fail_new_context:
+            self.fail_new_context -= 1
+            raise RuntimeError("Target page, context or browser has been closed")
+        context = FakeContext(self.fail_first, self.fail_content)
+        self.contexts.append(context)
+        return context
+
+
+async def _no_sleep(seconds):
+    pass
+
+
+def _run_scraper(browser):
+    from scrapers.base import BaseScraper
+
+    async def acquire():
+        return browser
+
+    async def release(b):
+        pass
+
+    with patch("scrapers.base.browser_pool.acquire", acquire), \
+            patch("scrapers.base.browser_pool.release", release), \
+            patch("scrapers.base.asyncio.sleep", _no_sleep):
+        scraper = BaseScraper("https://example.test/deals")
+        scraper.retailer_slug = "testshop"
+        return asyncio.run(scraper.run())
+
+
+class TestBaseScraperRun:
+    def test_retries_reuse_context(self, screenshots_dir):
+        """A failed attempt retries on a new page in the same context, with cookies cleared."""
+        browser = FakeBrowser(fail_first=1)
+        result = _run_scraper(browser)
+
+        assert result.status == "completed"
+        assert len(result.screenshot_paths) == 1
+        assert result.screenshot_paths[0].startswith("testshop/")
+        assert (screenshots_dir / result.screenshot_paths[0]).read_bytes() == b"\xff\xd8\xff"
+        assert gzip.decompress(result.html_gzip) == b"<html></html>"
+        assert len(browser.contexts) == 1
+        context = browser.contexts[0]
+        assert len(context.pages) == 2
+        assert all(page.closed for page in context.pages)
+        assert context.cookie_clears == 1
+        assert context.closed
+
+    def test_all_attempts_fail(self):
+        """When every attempt fails the result carries the last error and the context is closed."""
+        from scrapers.base import MAX_RETRIES
+        browser = FakeBrowser(fail_first=MAX_RETRIES)
+        result = _run_scraper(browser)
+
+        assert result.status == "failed"
+        assert "ERR_CONNECTION_RESET" in result.error_message
+        assert len(browser.contexts) == 1
+        assert len(browser.contexts[0].pages) == MAX_RETRIES
+        assert browser.contexts[0].closed
+
+    def test_failed_capture_leaves_no_screenshot(self, screenshots_dir):
+        """If the HTML capture fails, the screenshot taken alongside it is removed."""
+        before = set(screenshots_dir.rglob("*_screenshot.*"))
+        browser = FakeBrowser(fail_first=0, fail_content=True)
+        result = _run_scraper(browser)
+
+        assert result.status == "failed"
+        assert "has been closed" in result.error_message
+        assert result.screenshot_paths == []
+        assert set(screenshots_dir.rglob("*_screenshot.*")) == before
+
+    def test_failed_context_returns_browser_to_pool(self, screenshots_dir):
+        """If opening the context fails, the browser goes back to the pool before the retry."""
+        from scrapers.base import BaseScraper
+        from scrapers.browser_pool import BrowserPool
+
+        browser = FakeBrowser(fail_first=0, fail_new_context=1)
+        pool = BrowserPool(size=3)
+
+        async def launch():
+            pool._uses[browser] = 0
+            return browser
+
+        with patch.object(pool, "_launch", launch), \
+                patch("scrapers.base.browser_pool", pool), \
+                patch("scrapers.base.asyncio.sleep", _no_sleep):
+            scraper = BaseScraper("https://example.test/deals")
+            scraper.retailer_slug = "testshop"
+            result = asyncio.run(scraper.run())
+
+        assert result.status == "completed"
+        assert len(browser.contexts) == 1
+        assert browser.contexts[0].closed
+        assert pool._slots._value == pool.size
+
+
+class FakeLocator:
+    def __init__(self, page, selector):
+        self.page = page
+        self.selector = selector
+        self.first = self
+
+    async def count(self):
+        return sum(selector in self.selector for selector in self.page.shown)
+
+    async def click(self, timeout):
+        self.page.clicked.append(self.selector)
+
+
+class PopupPage:
+    def __init__(self, shown=()):
+        self.shown = [f"{selector}:visible" for selector in shown]
+        self.queries = []
+        self.clicked = []
+
+    def locator(self, selector):
+        self.queries.append(selector)
+        return FakeLocator(self, selector)
+
+
+class TestDismissPopups:
+    popup_selectors = (("#consent", "button.accept"), ("#newsletter .close",))
+
+    def _dismiss(self, page):
+        from scrapers.base import BaseScraper
+        scraper = BaseScraper("https://example.test/deals")
+        scraper.popup_selectors = self.popup_selectors
+        with patch("scrapers.base.asyncio.sleep", _no_sleep):
+            asyncio.run(scraper.dismiss_popups(page))
+
+    def test_no_popups_is_one_query(self):
+        """Without a visible popup, one combined query is made and nothing is clicked."""
+        page = PopupPage()
+        self._dismiss(page)
+        assert page.queries == ["#consent:visible, button.accept:visible, #newsletter .close:visible"]
+        assert page.clicked == []
+
+    def test_clicks_each_visible_group(self):
+        """Each group with a visible button gets its first match clicked, in order."""
+        page = PopupPage(shown=["button.accept", "#newsletter .close"])
+        self._dismiss(page)
+        assert page.clicked == ["#consent:visible, button.accept:visible", "#newsletter .close:visible"]
+
+
+class FakeRoute:
+    def __init__(self, url, resource_type):
+        self.request = type("Request", (), {"url": url, "resource_type": resource_type})()
+        self.outcome = None
+
+    async def abort(self):
+        self.outcome = "abort"
+
+    async def continue_(self):
+        self.outcome = "continue"
+
+
+class TestRouteFilter:
+    @pytest.mark.parametrize("url, resource_type, outcome", [
+        ("https://www.bestbuy.ca/deals", "document", "continue"),
+        ("https://multimedia.bbycastatic.ca/laptop.jpg", "image", "continue"),
+        ("https://www.bestbuy.ca/fonts/hs.woff2", "font", "abort"),
+        ("https://www.bestbuy.ca/promo.mp4", "media", "abort"),
+        ("https://www.google-analytics.com/g/collect", "xhr", "abort"),
+        ("https://stats.g.doubleclick.net/j/collect", "script", "abort"),
+        ("https://notdoubleclick.net/app.js", "script", "continue"),
+    ])
+    def test_blocks_unneeded_requests(self, url, resource_type, outcome):
+        """Fonts, media and tracking hosts are aborted; pages, images and scripts load."""
+        from scrapers.base import BaseScraper
+        route = FakeRoute(url, resource_type)
+        asyncio.run(BaseScraper("https://www.bestbuy.ca/deals")._route_filter(route))
+        assert route.outcome == outcome
+
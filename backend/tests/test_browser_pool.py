@@ -0,0 +1,108 @@
+"""Tests for the shared Chromium browser pool."""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.closed = False
+
+    def is_connected(self):
+        return self.connected
+
+    async def close(self):
+        self.closed = True
+        self.connected = False
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    """A BrowserPool whose launches produce FakeBrowser instances instead of Chromium."""
+    from scrapers.browser_pool import BrowserPool
+    pool = BrowserPool(size=2, max_uses=3)
+    launched = []
+
+    async def fake_launch():
+        browser = FakeBrowser()
+        launched.append(browser)
+        pool._uses[browser] = 0
+        return browser
+
+    monkeypatch.setattr(pool, "_launch", fake_launch)
+    pool.launched = launched
+    return pool
+
+
+class TestBrowserPool:
+    def test_reuses_released_browser(self, pool):
+        """A released browser is handed to the next acquire instead of launching another."""
+        async def scenario():
+            first = await pool.acquire()
+            await pool.release(first)
+            second = await pool.acquire()
+            await pool.release(second)
+            return first, second
+
+        first, second = asyncio.run(scenario())
+        assert first is second
+        assert len(pool.launched) == 1
+        assert not first.closed
+
+    def test_caps_concurrent_browsers(self, pool):
+        """No more than size browsers are launched, however many scrapes overlap."""
+        async def scrape():
+            browser = await pool.acquire()
+            await asyncio.sleep(0.01)
+            await pool.release(browser)
+
+        async def scenario():
+            await asyncio.gather(*(scrape() for _ in range(6)))
+
+        asyncio.run(scenario())
+        assert len(pool.launched) == 2
+
+    def test_retires_worn_out_and_crashed_browsers(self, pool):
+        """Browsers past max_uses or disconnected are closed rather than reused."""
+        async def scenario():
+            for _ in range(3):
+                await pool.release(await pool.acquire())
+            crashed = await pool.acquire()
+            crashed.connected = False
+            await pool.release(crashed)
+            await pool.release(await pool.acquire())
+
+        asyncio.run(scenario())
+        assert [b.closed for b in pool.launched] == [True, True, False]
+
+    def test_shutdown_closes_everything(self, pool):
+        """shutdown closes idle browsers and the pool starts fresh afterwards."""
+        async def scenario():
+            first, second = await pool.acquire(), await pool.acquire()
+            await pool.release(first)
+            await pool.release(second)
+            await pool.shutdown()
+            await pool.release(await pool.acquire())
+
+        asyncio.run(scenario())
+        assert [b.closed for b in pool.launched] == [True, True, False]
+
+    def test_close_browsers_keeps_driver(self, pool):
+        """close_browsers frees the browsers after a run but keeps the Playwright driver for the next."""
+        driver = object()
+        pool._playwright = driver
+
+        async def scenario():
+            await pool.release(await pool.acquire())
+            await pool.close_browsers()
+
+        asyncio.run(scenario())
+        assert pool.launched[0].closed
+        assert pool._playwright is driver
@@ -0,0 +1,109 @@
+"""Tests for the in-process endpoint response cache."""
+
+import os
+import sys
+import time
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+
+def _endpoint(calls, **cache_args):
+    from api.cache import cached
+
+    @cached("test", **cache_args)
+    def endpoint(db, vendor=None):
+        calls.append(vendor)
+        return vendor
+
+    return endpoint
+
+
+class TestCached:
+    def test_least_recently_used_entry_evicted(self, monkeypatch):
+        """Past MAX_CACHE_ENTRIES the least recently used key is dropped, not a recently read one."""
+        from api import cache
+        monkeypatch.setattr(cache, "MAX_CACHE_ENTRIES", 2)
+        calls = []
+        endpoint = _endpoint(calls)
+
+        endpoint(db=None, vendor="HP")
+        endpoint(db=None, vendor="Dell")
+        endpoint(db=None, vendor="HP")      # cached; HP becomes most recently used
+        endpoint(db=None, vendor="Lenovo")  # evicts Dell
+        endpoint(db=None, vendor="HP")
+        endpoint(db=None, vendor="Dell")
+
+        assert calls == ["HP", "Dell", "Lenovo", "Dell"]
+        assert len(cache._cache) == 2
+
+    def test_expired_entries_removed(self, monkeypatch):
+        """Entries past max_age + stale_while_revalidate are deleted on the next insert."""
+        from api import cache
+        now = [1000.0]
+        monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+        calls = []
+        endpoint = _endpoint(calls, max_age=10, stale_while_revalidate=20)
+
+        endpoint(db=None, vendor="HP")
+        now[0] += 31
+        endpoint(db=None, vendor="Dell")
+
+        assert [key[2] for key in cache._cache] == [(("vendor", "Dell"),)]
+
+    def test_stale_entry_served_while_refreshed(self, monkeypatch):
+        """A stale entry comes back at once while a background thread recomputes it with its own session."""
+        from sqlalchemy.orm import Session
+        from api import cache
+        now = [1000.0]
+        monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+        data = {"value": "old"}
+        sessions = []
+
+        @cache.cached("test", max_age=10, stale_while_revalidate=20)
+        def endpoint(db):
+            sessions.append(db)
+            return data["value"]
+
+        assert endpoint(db=None) == "old"
+        data["value"] = "new"
+        now[0] += 15
+
+        assert endpoint(db=None) == "old"
+        _wait_for_refreshes(cache)
+        assert endpoint(db=None) == "new"
+        assert sessions[0] is None and isinstance(sessions[1], Session)
+        assert len(sessions) == 2
+
+    def test_clear_discards_running_refresh(self, monkeypatch):
+        """A refresh that started before clear_cache does not store its pre-clear value."""
+        import threading
+        from api import cache
+        now = [1000.0]
+        monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+        computing, cleared = threading.Event(), threading.Event()
+
+        @cache.cached("test", max_age=10, stale_while_revalidate=20)
+        def endpoint(db):
+            if db is not None:  # the background refresh
+                computing.set()
+                cleared.wait(timeout=5)
+            return "before clear"
+
+        endpoint(db=None)
+        now[0] += 15
+        endpoint(db=None)
+        assert computing.wait(timeout=5)
+        cache.clear_cache("test")
+        cleared.set()
+        _wait_for_refreshes(cache)
+
+        assert cache._cache == {}
+
+
+def _wait_for_refreshes(cache):
+    for _ in range(500):
+        if not cache._refreshing:
+            return
+        time.sleep(0.01)
+    raise AssertionError("background refresh did not finish")
@@ -0,0 +1,33 @@
+"""Tests for per-host request spacing."""
+
+import asyncio
+import os
+import sys
+import time
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+
+class TestHostRateLimiter:
+    def test_spaces_same_host_only(self):
+        """Repeat requests to one host wait min_interval; other hosts go straight through."""
+        from scrapers.rate_limiter import HostRateLimiter
+        limiter = HostRateLimiter()
+        done = {}
+
+        async def request(name, host):
+            await limiter.acquire(host, 0.1)
+            done[name] = time.monotonic()
+
+        async def scenario():
+            start = time.monotonic()
+            await asyncio.gather(
+                request("a1", "www.bestbuy.ca"), request("a2", "www.bestbuy.ca"), request("b1", "www.staples.ca"),
+            )
+            return start
+
+        start = asyncio.run(scenario())
+        assert done["a1"] - start < 0.05
+        assert done["b1"] - start < 0.05
+        assert done["a2"] - start >= 0.09
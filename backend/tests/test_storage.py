@@ -25,6 +25,14 @@ class TestSaveScreenshot:
         assert "2026-02-12" in rel_path
         assert rel_path.endswith(".png")
 
+    def test_saves_jpeg_file(self, screenshots_dir):
+        """save_screenshot uses a .jpg suffix for JPEG screenshots, which list_screenshots includes."""
+        from scrapers.utils.storage import list_screenshots, save_screenshot
+        rel_path = save_screenshot("bestbuy", b"\xff\xd8\xff" + b"\x00" * 50, scrape_date=date(2026, 2, 13),
+                                   image_format="jpeg")
+        assert rel_path.endswith("_screenshot.jpg")
+        assert [s["path"] for s in list_screenshots("bestbuy", "2026-02-13")] == [rel_path]
+
     def test_creates_directory_structure(self, screenshots_dir):
         """save_screenshot creates retailer/date subdirectories."""
         from scrapers.utils.storage import save_screenshot
@@ -34,15 +42,16 @@ class TestSaveScreenshot:
 
 class TestSaveHtml:
     def test_saves_html_file(self, screenshots_dir):
-        """save_html creates an HTML file in the correct directory."""
+        """save_html writes the gzipped HTML file in the correct directory."""
+        import gzip
         from scrapers.utils.storage import save_html
         html = "<html><body>Test page</body></html>"
-        rel_path = save_html("staples", html, scrape_date=date(2026, 2, 12))
+        rel_path = save_html("staples", gzip.compress(html.encode("utf-8")), scrape_date=date(2026, 2, 12))
 
         full_path = screenshots_dir / rel_path
         assert full_path.exists()
-        assert full_path.read_text(encoding="utf-8") == html
-        assert rel_path.endswith(".html")
+        assert gzip.decompress(full_path.read_bytes()).decode("utf-8") == html
+        assert rel_path.endswith(".html.gz")
 
 
 class TestSaveMetadata:
@@ -59,6 +68,17 @@ class TestSaveMetadata:
         assert loaded["retailer"] == "Walmart"
         assert loaded["status"] == "completed"
 
+    def test_serializes_datetimes_and_fallback_types(self, screenshots_dir):
+        """Datetimes are written as ISO 8601; other non-JSON values fall back to str()."""
+        from datetime import datetime, timezone
+        from scrapers.utils.storage import save_metadata
+        import json
+        metadata = {"started_at": datetime(2026, 2, 12, 10, 0, tzinfo=timezone.utc), "dir": Path("a/b")}
+        rel_path = save_metadata("walmart", metadata, scrape_date=date(2026, 2, 12))
+
+        loaded = json.loads((screenshots_dir / rel_path).read_text())
+        assert loaded == {"started_at": "2026-02-12T10:00:00+00:00", "dir": "a/b"}
+
 
 class TestListScreenshots:
     def test_list_all(self, screenshots_dir):
@@ -100,6 +120,17 @@ class TestListScreenshots:
         assert len(results) >= 1
         assert results[0]["size_bytes"] == len(png_data)
 
+    def test_limit_returns_newest_first(self, screenshots_dir):
+        """list_screenshots with a limit returns the head of the full listing."""
+        from scrapers.utils.storage import list_screenshots, save_screenshot
+        for day in (1, 2, 2, 3):
+            save_screenshot("limitshop", b"\x89PNG" + b"\x00" * 10, scrape_date=date(2026, 8, day))
+
+        full = list_screenshots(retailer_slug="limitshop")
+        limited = list_screenshots(retailer_slug="limitshop", limit=3)
+        assert limited == full[:3]
+        assert [s["date"] for s in limited] == ["2026-08-03", "2026-08-02", "2026-08-02"]
+
     def test_empty_when_no_files(self, screenshots_dir):
         """list_screenshots returns empty list for nonexistent retailer."""
         from scrapers.utils.storage import list_screenshots